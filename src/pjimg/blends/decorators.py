@@ -114,8 +114,7 @@ def will_clip(fn: Blend) -> Blend:
     @wraps(fn)
     def wrapper(a: ImgAry, b: ImgAry, *args, **kwargs) -> ImgAry:
         ab = fn(a, b, *args, **kwargs)
-        ab[ab < 0.0] = 0.0
-        ab[ab > 1.0] = 1.0
+        np.clip(ab, 0.0, 1.0, out=ab)
         return ab
     return wrapper
 
@@ -138,8 +138,8 @@ def cut_highlight(a: ImgAry, threshold: float) -> ImgAry:
     :returns: A :class:`np.ndarray` object.
     :rtype: numpy.ndarray
     """
-    a[a > threshold] = threshold
-    a = a / threshold
+    a = np.minimum(a, threshold)
+    a /= threshold
     return a
 
 
@@ -160,8 +160,8 @@ def cut_shadow(a: ImgAry, threshold: float) -> ImgAry:
     """
     a = 1.0 - a
     threshold = 1.0 - threshold
-    a[a > threshold] = threshold
-    a = a / threshold
+    np.minimum(a, threshold, out=a)
+    a /= threshold
     return 1.0 - a
 
 
@@ -230,10 +230,7 @@ class TilePattern(ABC):
             vso = self.vso
         
         vvo = 2 * vso
-        return [np.array([[
-            (
-                vp * np.cos(o + i * vvo) + center[x],
-                vp * np.sin(o + i * vvo) + center[y],
-            )
-            for i in range(sides)
-        ]], dtype=np.int32),]
+        vos = o + np.arange(sides) * vvo
+        ys, xs = translate_by_polar_coords_batch(center, vp, vos)
+        vertices = np.stack((xs, ys), -1)
+        return [vertices[np.newaxis].astype(np.int32),]
@@ -93,8 +93,10 @@ class Perlin(un.UnitNoise):
         whole, parts = self._map_unit_grid(size, loc)
         fades = 6 * parts ** 5 - 15 * parts ** 4 + 10 * parts ** 3
         grids = self._build_grids(whole, size, shape)
-        for grid in grids:
-            grids[grid] = self._grad(grid, grids[grid], parts)
+        grids = [
+            self._grad(key, grid, parts)
+            for key, grid in zip(self._hashes, grids)
+        ]
         a = self._interp(grids, fades)
         return (a + 1) / 2
 
@@ -103,21 +105,21 @@ class Perlin(un.UnitNoise):
         self, whole: IntAry64,
         size: Sequence[float],
         shape: Size
-    ) -> dict[str, IntAry64]:
+    ) -> list[IntAry64]:
         """Get the color for the eight vertices that surround each of
         the pixels.
         """
-        grids = {}
+        grids = []
         for key in self._hashes:
             grid_whole = whole.copy()
             for axis in range(self._axes):
-                grid_whole[axis] += int(key[axis])
+                grid_whole[axis] += (key >> (self._axes - axis - 1)) & 1
 
             a_grid = grid_whole[Z].astype(np.int64)
             for axis in (Y, X):
                 a_grid = np.take(self._table, a_grid) + grid_whole[axis]
 
-            grids[key] = a_grid
+            grids.append(a_grid)
         return grids
 
     def _grad(self, loc_mask, grid, parts):
@@ -141,11 +143,11 @@ class Perlin(un.UnitNoise):
         z = parts[Z].copy()
         y = parts[Y].copy()
         x = parts[X].copy()
-        if loc_mask[0] == '1':
+        if loc_mask & 0b100:
             z -= 1
-        if loc_mask[1] == '1':
+        if loc_mask & 0b010:
             y -= 1
-        if loc_mask[2] == '1':
+        if loc_mask & 0b001:
             x -= 1
         
         # Calculate the dot products and return the result.
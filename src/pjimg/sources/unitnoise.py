@@ -117,9 +117,8 @@ class UnitNoise(Noise):
             table = self._init_table()
         self._table = table
 
-        # Prime the names of the grids used for interpolation.
-        tmp = '{:>0' + str(self._axes) + 'b}'
-        self._hashes = [tmp.format(n) for n in range(2 ** self._axes)]
+        # Prime the identifiers of the grids used for interpolation.
+        self._hashes = range(2 ** self._axes)
 
     # Public methods.
     def fill(
@@ -145,19 +144,20 @@ class UnitNoise(Noise):
         self, whole: IntAry64,
         size: Size,
         shape: Size
-    ) -> dict[str, IntAry64]:
+    ) -> list[IntAry64]:
         """Get the color for the eight vertices that surround each of
         the pixels.
         """
-        grids = {}
+        grids = []
         
         # The _hashes here are identifiers for each of the eight vertices
         # that surround any given point. It's a binary number with one
-        # digit per dimension in the noise being generated. The digit
-        # indicates whether to use the vertex before or after the given
-        # point. Therefore, if the value of `key` is `010`, it would be
-        # generating the grid based on the vertices before the point on
-        # the Z and X axes but after the point on the Y axis.
+        # bit per dimension in the noise being generated, starting with
+        # the most significant bit. The bit indicates whether to use the
+        # vertex before or after the given point. Therefore, if the value
+        # of `key` is `0b010`, it would be generating the grid based on
+        # the vertices before the point on the Z and X axes but after the
+        # point on the Y axis.
         for key in self._hashes:
             
             # Identify the multidimensional indices of the vertex for
@@ -165,7 +165,7 @@ class UnitNoise(Noise):
             grid_whole = whole.copy()
             a_grid = np.zeros(size, dtype=np.int64)
             for axis in range(self._axes):
-                grid_whole[axis] += int(key[axis])
+                grid_whole[axis] += (key >> (self._axes - axis - 1)) & 1
 
             # The values of the vertices are stored in a one-dimensional
             # array. This translates the multidimensional indices into
@@ -180,9 +180,9 @@ class UnitNoise(Noise):
                 a_grid %= len(self._table)
 
             # Get the value of the vertex for each point and store it in
-            # a dictionary by the identifier for the vertex.
+            # a list in the order of the identifiers for the vertices.
             a_grid = np.take(self._table, a_grid)
-            grids[key] = a_grid
+            grids.append(a_grid)
         return grids
 
     def _calc_unit_grid_shape(self, size: Size):
@@ -228,23 +228,21 @@ class UnitNoise(Noise):
 
     def _interp(
         self, grids: Union[
-            dict[str, IntAry64],
-            dict[str, RatioAry]
+            list[IntAry64],
+            list[RatioAry]
         ],
         parts: RatioAry
     ) -> ImgAry:
         """Interpolate the values of each pixel of image data."""
-        if len(grids) > 2:
-            new_grids = {}
-            evens = [k for k in grids if k.endswith('0')]
-            odds = [k for k in grids if k.endswith('1')]
-            for even, odd in zip(evens, odds):
-                new_key = even[:-1]
-                axis = len(new_key)
-                new_grids[new_key] = lerp(grids[even], grids[odd], parts[axis])
-            return self._interp(new_grids, parts)
-
-        return lerp(grids['0'], grids['1'], parts[Z])
+        # The vertices that only differ on the last axis are next to
+        # each other in the grids, so each pass interpolates those
+        # pairs along that axis until only one grid is left.
+        for axis in range(self._axes - 1, -1, -1):
+            grids = [
+                lerp(before, after, parts[axis])
+                for before, after in zip(grids[::2], grids[1::2])
+            ]
+        return grids[0]
 
 
 class Curtains(UnitNoise):
@@ -14,7 +14,7 @@ from typing import Optional, Sequence
 import numpy as np
 from numpy.typing import NDArray
 
-from pjimg.util import ImgAry, IntAry64, Loc, Size
+from pjimg.util import ImgAry, Loc, Size, X, Y, Z
 from pjimg.sources.model import Seed, Source
 from pjimg.sources.noise import Noise
 
@@ -53,6 +53,10 @@ class Worley(Noise):
         same values. Note: strings that are passed to seed will
         be converted to UTF-8 bytes before being converted to
         integers for seeding.
+    :param squared: (Optional.) Use the squared distance to the
+        nearest point rather than the distance. This skips taking
+        the square root of the distances, and it makes the edges
+        of the cells fall off more sharply.
     :return: :class:`Worley` object.
     :rtype: sources.worley.Worley
     
@@ -69,15 +73,20 @@ class Worley(Noise):
        The image data created by the usage example.
     
     """
+    # The number of pixels mapped at a time by :meth:`Worley.fill`.
+    _block_size = 2 ** 16
+
     def __init__(
         self, points: int,
         volume: Optional[Size] = None,
         origin: Loc = (0, 0, 0),
-        seed: Seed = None
+        seed: Seed = None,
+        squared: bool = False
     ) -> None:
         self.points = int(points)
         self.volume = volume
         self.origin = origin
+        self.squared = squared
         super().__init__(seed)
 
     def fill(
@@ -92,35 +101,77 @@ class Worley(Noise):
         :return: An :class:`numpy.ndarray` with image data.
         :rtype: numpy.ndarray
         """
-        a = np.zeros(size, dtype=float)
-        volume_size = self.volume
-        if volume_size is None:
-            volume_size = size
-        volume = np.array(volume_size, dtype=float)
-
-        # Place the seeds in the overall volume of noise.
-        seeds = self._rng.random((self.points, 3), dtype=float)
-        seeds = np.around(seeds * (volume - 1)).astype(float)
-        seeds += np.array(self.origin)
-
-        # Map the distances to the points.
-        indices = np.indices(size)
-        max_dist = np.sqrt(sum(n ** 2 for n in size))
-        dist = np.zeros(size, dtype=float)
-        dist.fill(max_dist)
-        for i in range(self.points):
-            point = seeds[i]
-            work = self._hypot(point, indices)
-            dist[work < dist] = work[work < dist]
-
-        act_max_dist = np.max(dist)
-        a = dist / act_max_dist
-        return a
+        seeds = self._place_seeds(size)
+        return self._map_fill(size, seeds)
 
     # Private methods.
-    def _hypot(self, point: Loc, indices: IntAry64) -> ImgAry:
-        axis_dist = [p - i for p, i in zip(point, indices)]
-        return np.sqrt(sum(d ** 2 for d in axis_dist))
+    def _map_block(
+        self, block: ImgAry,
+        z: int,
+        y: int,
+        seeds: NDArray[np.float_],
+        max_dist_sq: float
+    ) -> None:
+        """Map the squared distance from each pixel in a block of rows
+        to its nearest seed, up to the given maximum.
+        """
+        # Open grids broadcast against each other, so the Y and X
+        # indices don't have to be built out to the full block. The
+        # Z distance is the same for every pixel in the block, so it
+        # is just a constant for each seed.
+        yy, xx = np.ogrid[y:y + block.shape[0], 0:block.shape[1]]
+        block.fill(max_dist_sq)
+        for sz, sy, sx in seeds:
+            work = (sz - z) ** 2 + (sy - yy) ** 2 + (sx - xx) ** 2
+            np.minimum(block, work, out=block)
+
+    def _map_fill(self, size: Size, seeds: NDArray[np.float_]) -> ImgAry:
+        """Map the distance from each pixel to its nearest seed,
+        normalized so the farthest pixel is one.
+        """
+        # Work through the volume a block of rows at a time. A block
+        # is small enough to stay in cache while every seed is checked
+        # against it, rather than streaming the whole volume through
+        # memory once for each seed.
+        #
+        # Seeds can be outside of the fill, so distances are capped
+        # at the length of the diagonal of the fill.
+        dist = np.empty(size, dtype=float)
+        max_dist_sq = float(sum(n ** 2 for n in size))
+        act_max_dist = 0.0
+        rows = max(1, self._block_size // size[X])
+        for z in range(size[Z]):
+            for y in range(0, size[Y], rows):
+                block = dist[z, y:y + rows]
+                self._map_block(block, z, y, seeds, max_dist_sq)
+
+                # Squared distances sort the same way as distances, so
+                # the square root only needs to be taken once after the
+                # nearest seeds are found, or not at all if squared
+                # distances were requested. Doing it and finding the
+                # maximum while the block is still in cache saves two
+                # more passes over the whole volume.
+                if not self.squared:
+                    np.sqrt(block, out=block)
+                act_max_dist = max(act_max_dist, block.max())
+
+        dist /= act_max_dist
+        return dist
+
+    def _place_seeds(self, size: Size) -> NDArray[np.float_]:
+        """Randomly place the seeds within the volume."""
+        volume = self.volume
+        if volume is None:
+            volume = size
+
+        # The seeds are scaled, rounded, and offset in place to avoid
+        # creating a new array for each step. The random values are
+        # still drawn as float64, so seeded noise doesn't change.
+        seeds = self._rng.random((self.points, 3), dtype=float)
+        seeds *= np.subtract(volume, 1)
+        np.around(seeds, out=seeds)
+        seeds += self.origin
+        return seeds
 
 
 class OctaveWorley(Source):
@@ -158,6 +209,8 @@ class OctaveWorley(Source):
         same values. Note: strings that are passed to seed will
         be converted to UTF-8 bytes before being converted to
         integers for seeding.
+    :param squared: (Optional.) Use the squared distance to the
+        nearest point rather than the distance in each octave.
     :return: :class:`OctaveWorley` object.
     :rtype: sources.worley.OctaveWorley
     
@@ -189,7 +242,8 @@ class OctaveWorley(Source):
         points: int = 10,
         volume: Optional[Size] = None,
         origin: Loc = (0, 0, 0),
-        seed: Seed = None
+        seed: Seed = None,
+        squared: bool = False
     ) -> None:
         self.octaves = octaves
         self.persistence = persistence
@@ -199,6 +253,7 @@ class OctaveWorley(Source):
         self.volume = volume
         self.origin = origin
         self.seed = seed
+        self.squared = squared
     
     def fill(
         self, size: Sequence[int],
@@ -214,7 +269,8 @@ class OctaveWorley(Source):
                 points=points,
                 volume=self.volume,
                 origin=self.origin,
-                seed=self.seed
+                seed=self.seed,
+                squared=self.squared
             )
             a += octave.fill(size, loc) * amp
             max_value += amp
@@ -6,6 +6,9 @@ Utilities useful for debugging code that uses :mod:`pjimg`.
 
 .. autofunction:: pjimg.util.debug.print_array
 """
+import sys
+from textwrap import indent
+
 import numpy as np
 
 from pjimg.util.model import NumAry
@@ -20,18 +23,22 @@ def print_array(a: NumAry, depth: int = 0) -> None:
     :return: None.
     :rtype: NoneType
     """
-    if len(a.shape) > 1:
-        print(' ' * (4 * depth) + '[')
-        for i in range(a.shape[0]):
-            print_array(a[i], depth + 1)
-        print(' ' * (4 * depth) + '],')
-
+    # Integers are printed in hexadecimal and floats to four decimal
+    # places. Anything else uses numpy's default formatting.
+    if a.dtype.kind in 'iu':
+        formatter = {'int_kind': '0x{:02x}'.format}
+    elif a.dtype.kind == 'f':
+        formatter = {'float_kind': '{:>1.4f}'.format}
     else:
-        if a.dtype in [int, np.uint, np.uint8]:
-            tmp = '0x{:02x}'
-        elif a.dtype in [float, np.float32, np.float64]:
-            tmp = '{:>1.4f}'
-        else:
-            tmp = '{}'
-        nums = [tmp.format(n) for n in a]
-        print(' ' * (4 * depth) + '[' + ', '.join(nums) + '],')
+        formatter = None
+
+    # Format the whole array in one call rather than walking it
+    # row by row, so large arrays can still be printed.
+    text = np.array2string(
+        a,
+        max_line_width=79,
+        separator=', ',
+        formatter=formatter,
+        threshold=sys.maxsize
+    )
+    print(indent(text, ' ' * (4 * depth)) + ',')
@@ -13,11 +13,15 @@ from pjimg.util.model import Interpolator, NumAry
 # Decorators.
 def preserves_type(fn: Interpolator) -> Interpolator:
     """Ensure the datatype of the result is the same as the
-    first parameter.
+    first parameter. The result is only copied if its datatype
+    has to change. If the result was stored in an array that was
+    passed in, it is returned as it is.
     """
     @wraps(fn)
     def wrapper(a: NumAry, *args, **kwargs) -> NumAry:
         a_dtype = a.dtype
         result = fn(a, *args, **kwargs)
-        return result.astype(a_dtype)
+        if any(result is arg for arg in (*args, *kwargs.values())):
+            return result
+        return result.astype(a_dtype, copy=False)
     return wrapper
@@ -35,7 +35,8 @@ def cubic_interpolation(
     b: NumAry,
     x: RatioAry,
     a_: Optional[NumAry] = None,
-    b_: Optional[NumAry] = None
+    b_: Optional[NumAry] = None,
+    out: Optional[NumAry] = None
 ) -> NumAry:
     """Perform a cubic interpolation on the values of four arrays.
     This is adapted from code found at: `Cubic Interpolation`_
@@ -47,6 +48,11 @@ def cubic_interpolation(
     :param x: How close the final value is to the closest "left" value.
     :param a_: (Optional.) The farther value on the "left" side.
     :param b_: (Optional.) The farther value on the "right" side.
+    :param out: (Optional.) An array to store the result in. It must
+        not be any of the value arrays. If it can't hold the datatype
+        of the interpolation, such as an integer array when the
+        distances are floats, the interpolation is done in a new
+        array that is then copied into it.
     :return: A :class:`numpy.ndarray` object.
     :rtype: numpy.ndarray
 
@@ -91,11 +97,40 @@ def cubic_interpolation(
         b_ = np.roll(b, -1, -1)
         b_[..., -1] = b[..., -1]
 
-    # Perform the interpolation. This is broken up to keep it within
-    # the 80 character width limit.
-    part1 = (3 * (a - b) + b_ - a_)
-    part2 = (2 * a_ - 5 * a + 4 * b - b_ + x * part1)
-    return a + 0.5 * x * (b - a_ + x * part2)
+    # Perform the interpolation. The polynomial is evaluated in
+    # Horner form in place in a single output array, using one
+    # scratch array for the scaled terms, rather than allocating
+    # a new array for every step of the calculation. The steps that
+    # only use the value arrays are done in the result type, since
+    # otherwise they would be done in the type of the value arrays
+    # and unsigned integers would wrap around. If the given output
+    # array can't hold the result type, a new array is used and then
+    # copied into it.
+    dtype = np.result_type(a, b, x, a_, b_)
+    dest = out
+    if out is None or not np.can_cast(dtype, out.dtype, 'same_kind'):
+        shape = np.broadcast_shapes(
+            np.shape(a), np.shape(b), np.shape(x),
+            np.shape(a_), np.shape(b_)
+        )
+        dest = np.empty(shape, dtype=dtype)
+    work = np.empty_like(dest)
+    np.subtract(a, b, out=dest, dtype=dest.dtype)
+    dest *= 3
+    dest += b_
+    dest -= a_
+    dest *= x
+    dest += np.multiply(a_, 2, out=work, dtype=work.dtype)
+    dest -= np.multiply(a, 5, out=work, dtype=work.dtype)
+    dest += np.multiply(b, 4, out=work, dtype=work.dtype)
+    dest -= b_
+    dest *= x
+    dest += b
+    dest -= a_
+    dest *= x
+    dest *= 0.5
+    dest += a
+    return _store(dest, out)
 
 
 @preserves_type
@@ -103,6 +138,7 @@ def linear_interpolation(
     a: NumAry,
     b: NumAry,
     x: RatioAry,
+    out: Optional[NumAry] = None
 ) -> NumAry:
     """Perform a linear interpolation on the values of two arrays
 
@@ -111,6 +147,12 @@ def linear_interpolation(
     :param b: The "right" values.
     :param x: An array of how close the location of the final value
         should be to the "left" value.
+    :param out: (Optional.) An array to store the result in. It can
+        be the "right" values, but it must not be the "left" values.
+        If it can't hold the datatype of the interpolation, such as
+        an integer array when the distances are floats, the
+        interpolation is done in a new array that is then copied
+        into it.
     :return: A :class:`numpy.ndarray` object.
     :rtype: numpy.ndarray
 
@@ -124,7 +166,20 @@ def linear_interpolation(
         >>> linear_interpolation(a, b, x)
         array([2, 3, 4])
     """
-    return a * (1 - x) + b * x
+    # This is done as a + x * (b - a) in place in a single array
+    # rather than a * (1 - x) + b * x, which needs four arrays. The
+    # subtraction is done in the result type so unsigned integers
+    # don't wrap around. If the given output array can't hold the
+    # result type, a new array is used and then copied into it.
+    dtype = np.result_type(a, b, x)
+    dest = out
+    if out is None or not np.can_cast(dtype, out.dtype, 'same_kind'):
+        shape = np.broadcast_shapes(np.shape(a), np.shape(b), np.shape(x))
+        dest = np.empty(shape, dtype=dtype)
+    np.subtract(b, a, out=dest, dtype=dest.dtype)
+    dest *= x
+    dest += a
+    return _store(dest, out)
 
 
 def n_dimensional_interpolation(
@@ -152,7 +207,7 @@ def n_dimensional_interpolation(
         >>> x = x.reshape((2, 3, 3))
         >>> n_dimensional_interpolation(a, b, x, lerp)
         array([[135, 150, 165],
-               [179, 194, 210],
+               [179, 195, 210],
                [225, 240, 255]])
     """
     # N-dimensional interpolation uses the nearest points to make a
@@ -164,17 +219,16 @@ def n_dimensional_interpolation(
         msg = 'Not the correct number of points for the dimensions.'
         raise ValueError(msg)
 
-    # Interpolate the points.
-    # Doing this as a loop rather than recursively seems to be more
-    # memory efficient.
-    for i in range(len(x) - 1, -1, -1):
-        print(i)
-        result = interpolator(a, b, x[i])
-        if i != 0:
-            a = result[::2]
-            b = result[1::2]
-            del result
-    
+    # Interpolate the points one axis at a time, starting with the
+    # last axis. Each pass halves the number of points, and the
+    # results of a pass become the points of the next pass. Doing
+    # this as a loop rather than recursively is more memory efficient.
+    for axis_x in x[:0:-1]:
+        result = interpolator(a, b, axis_x)
+        a = result[::2]
+        b = result[1::2]
+    result = interpolator(a, b, x[0])
+
     # The extra dimension in the result is caused by the extra
     # dimension in a, b, and x to hold the arrays that will be
     # interpolated. The only way to avoid it would be to iterate
@@ -223,6 +277,17 @@ def n_dimensional_linear_interpolation(
     return n_dimensional_interpolation(a, b, x, linear_interpolation)
 
 
+# Private functions.
+def _store(result: NumAry, out: Optional[NumAry]) -> NumAry:
+    """Copy the result of an interpolation into the given output
+    array if it wasn't done in that array.
+    """
+    if out is None or result is out:
+        return result
+    np.copyto(out, result, casting='unsafe')
+    return out
+
+
 # Function aliases.
 cerp = cubic_interpolation
 lerp = linear_interpolation
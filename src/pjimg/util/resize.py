@@ -10,10 +10,14 @@ Functions for resizing numpy arrays.
 .. autofunction:: pjimg.util.pad_array
 .. autofunction:: pjimg.util.resize_array
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from math import prod
 from typing import Optional, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from pjimg.util import lerps as lp
 from pjimg.util.constants import X, X_, Y, Y_, Z, Z_
@@ -29,8 +33,28 @@ __all__ = [
 ]
 
 
+# Threads used to resize the Z planes in trilinear_interpolation. The
+# pool is shared by every call, and its threads are only started the
+# first time they are needed. Threads don't help with only one CPU.
+_threads = ThreadPoolExecutor() if (os.cpu_count() or 1) > 1 else None
+
+# Planes smaller than this many pixels are resized faster in the
+# calling thread than they can be handed off to the pool.
+_threaded_plane_size = 2 ** 16
+
+# Resizing matrices are only cached when the new shape has at most
+# this many elements times its number of dimensions. The matrices
+# are many times the size of the resized array, so caching them for
+# large arrays would hold a lot of memory for the life of the process.
+_cached_matrix_size = 2 ** 20
+
+
 # Public functions.
-def bilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
+def bilinear_interpolation(
+    a: ImgAry,
+    factor: float,
+    dtype: Optional[DTypeLike] = None
+) -> ImgAry:
     """Resize an two dimensional array using trilinear
     interpolation.
 
@@ -40,6 +64,11 @@ def bilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
         interpolation works, you probably don't get great results
         with factor less than or equal to .5. Consider multiple
         passes of interpolation with larger factors in those cases.
+    :param dtype: (Optional.) The datatype to perform the interpolation
+        in. Using :class:`numpy.float32` halves the memory used at
+        the cost of precision. The result is still returned in the
+        datatype of the original array. Defaults to the datatype of
+        the original array.
     :return: A :class:ndarray object.
     :rtype: numpy.ndarray
     """
@@ -47,91 +76,8 @@ def bilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
     if factor == 1:
         return a
 
-    # Perform a defensive copy of the original array to avoid
-    # unexpected side effects.
-    a = a.copy()
-
-    # Since we are magnifying the given array, the new array's shape
-    # will increase by the magnification factor.
-    mag_size = tuple(int(s * factor) for s in a.shape)
-
-    # Map out the relationship between the old space and the
-    # new space.
-    indices = np.indices(mag_size)
-    if factor > 1:
-        whole = (indices // factor).astype(int)
-        parts = (indices / factor - whole).astype(float)
-    else:
-        new_ends = [s - 1 for s in mag_size]
-        old_ends = [s - 1 for s in a.shape]
-        true_factors = [n / o for n, o in zip(new_ends, old_ends)]
-        for i in range(len(true_factors)):
-            if true_factors[i] == 0:
-                true_factors[i] = .5
-        whole = indices.copy()
-        parts = indices.copy()
-        for i in Y_, X_:
-            whole[i] = (indices[i] // true_factors[i]).astype(int)
-            parts[i] = (indices[i] / true_factors[i] - whole[i]).astype(float)
-    del indices
-
-    # Trilinear interpolation determines the value of a new pixel by
-    # comparing the values of the eight old pixels that surround it.
-    # The hashes are the keys to the dictionary that contains those
-    # old pixel values. The key indicates the position of the pixel
-    # on each axis, with one meaning the position is ahead of the
-    # new pixel, and zero meaning the position is behind it.
-    hashes = [f'{n:>02b}'[::-1] for n in range(2 ** 2)]
-    hash_table = {}
-
-    # The original array needs to be made one dimensional for the
-    # numpy.take operation that will occur as we build the tables.
-    raveled = np.ravel(a)
-
-    # Build the table that contains the old pixel values to
-    # interpolate.
-    for hash in hashes:
-        hash_whole = whole.copy()
-
-        # Use the hash key to adjust the which old pixel we are
-        # looking at.
-        for axis in Y_, X_:
-            if hash[axis] == '1':
-                hash_whole[axis] += 1
-
-                # Handle the pixels that were pushed off the far
-                # edge of the original array by giving them the
-                # value of the last pixel along that axis in the
-                # original array.
-                m = np.zeros(hash_whole[axis].shape, dtype=bool)
-                m[hash_whole[axis] >= a.shape[axis]] = True
-                hash_whole[axis][m] = a.shape[axis] - 1
-
-        # Since numpy.take() only works in one dimension, we need to
-        # map the three dimensional indices of the original array to
-        # the one dimensional indices used by the raveled version of
-        # that array.
-        raveled_indices = hash_whole[Y_] * a.shape[X_]
-        raveled_indices += hash_whole[X_]
-
-        # Get the value of the pixel in the original array.
-        hash_table[hash] = np.take(raveled, raveled_indices.astype(int))
-
-    # Once the hash table has been built, clean up the working arrays
-    # in case we are running short on memory.
-    else:
-        del hash_whole, raveled_indices, whole
-
-    # Everything before this was to set up the interpolation. Now that
-    # it's set up, we perform the interpolation. Since we are doing
-    # this across three dimensions, it's a three stage process. Stage
-    # one is along the X_ axis.
-    x1 = lp.lerp(hash_table['00'], hash_table['01'], parts[X_])
-    x2 = lp.lerp(hash_table['10'], hash_table['11'], parts[X_])
-
-    # And stage three is along the Z axis. Since this is the last step
-    # we can just return the result.
-    return lp.lerp(x1, x2, parts[Y_])
+    # The original array is only read from, so it isn't copied.
+    return _resize_by_factor(a, factor, (Y_, X_), dtype)
 
 
 def build_resizing_matrices(
@@ -141,54 +87,27 @@ def build_resizing_matrices(
     """Create the indexing and distance arrays needed to interpolate
     values when resizing an array.
 
+    The two index arrays have the shape `(2 ** (n - 1), n, *dst_shape)`,
+    where `n` is the number of dimensions. The first axis is the point
+    being interpolated from, and the second is the axis of the original
+    array the index is for. The first index array holds the points
+    before the interpolated value on the last axis, and the second
+    holds the points after it. The distance array has the shape
+    `(n, *dst_shape)`.
+
+    The arrays for the most recently used small shapes are cached,
+    so they are returned read-only.
+
     :param src_shape: The original shape of the array.
     :param dst_shape: The resized shape of the array.
     :return: A :class:`tuple` object.
     :rtype: tuple
     """
-    # Interpolation guesses a value between known data values. To
-    # do this you need to know those points. The number of points
-    # surrounding the value being guessed is the square of the
-    # dimensions in the array.
-    num_dim = len(src_shape)
-    axes = range(num_dim)
-    points = range(2 ** num_dim)
-
-    # The relative positions of the points compared to the interpolated
-    # value is coded by a binary text string where 1 is after the value
-    # on the axis and 0 is before the value.
-    rel_positions = _build_relative_position_masks(num_dim)
-
-    # Create the map for position 0, which is before the interpolated
-    # value on every axis.
-    factors = _get_resizing_factors(src_shape, dst_shape)
-    src_indices, x = _map_indices_and_distances(dst_shape, factors)
-
-    # Create the maps for the rest of the positions.
-    matrix_shape = (len(points) // 2, num_dim, *dst_shape)
-    a = np.zeros(matrix_shape, dtype=int)
-    b = a.copy()
-    for pos in rel_positions:
-        matrix_index = int(pos, 2) // 2
-        pos_indices = src_indices.copy()
-        for axis in axes:
-            if pos[axis] == '1':
-                working = pos_indices[axis]
-                working += 1
-
-                # Cap the values in the array to the highest index in
-                # the original array.
-                cap = src_shape[axis] - 1
-                working[working > cap] = cap
-
-        # Put the value in the correct side of the resizing matrices.
-        if pos.endswith('0'):
-            a[matrix_index] = pos_indices
-        else:
-            b[matrix_index] = pos_indices
-
-    # Return the arrays for the resizing interpolation.
-    return a, b, x
+    src_shape = tuple(src_shape)
+    dst_shape = tuple(dst_shape)
+    if len(dst_shape) * prod(dst_shape) > _cached_matrix_size:
+        return _build_resizing_matrices.__wrapped__(src_shape, dst_shape)
+    return _build_resizing_matrices(src_shape, dst_shape)
 
 
 def crop_array(a: NumAry, new_size: Size, loc: Loc = (0, 0, 0)) -> NumAry:
@@ -215,6 +134,11 @@ def magnify_size(shape: Size, factor: int) -> Size:
     :param factor: The magnification factor.
     :return: A :class:`tuple` containing the shape of the magnified array.
     """
+    # Most shapes are three dimensional, and unpacking them directly
+    # avoids the overhead of the generator.
+    if len(shape) == 3:
+        z, y, x = shape
+        return int(z * factor), int(y * factor), int(x * factor)
     return tuple(int(n * factor) for n in shape)
 
 
@@ -248,7 +172,9 @@ def pad_array(
 def resize_array(
     src: NumAry,
     shape: Size,
-    interpolator: Interpolator = lp.ndlerp
+    interpolator: Interpolator = lp.ndlerp,
+    dtype: Optional[DTypeLike] = None,
+    out: Optional[NumAry] = None
 ) -> NumAry:
     """Resize a two dimensional array using an interpolation.
 
@@ -256,28 +182,60 @@ def resize_array(
         least two dimensions.
     :param shape: The shape for the resized array.
     :param interpolator: The interpolation algorithm for the resizing.
+    :param dtype: (Optional.) The datatype to perform the interpolation
+        in. Using :class:`numpy.float32` halves the memory used at
+        the cost of precision. The result is still returned in the
+        datatype of the original array. Defaults to the datatype of
+        the original array.
+    :param out: (Optional.) An array with the new shape to store the
+        resized array in. Reusing the same array when resizing many
+        arrays of the same shape avoids allocating a new one each time.
     :return: A :class:`numpy.ndarray` object.
     :rtype: numpy.ndarray
     """
-    # Perform defensive actions to prevent unneeded processing if
-    # the array won't actually change and to make sure any changes
-    # to the array won't have unexpected side effects.
+    # Prevent unneeded processing if the array won't actually change.
+    # The original array is only read from, so it isn't copied unless
+    # there is an array to store the result in.
     if shape == src.shape:
+        if out is not None:
+            np.copyto(out, src, casting='unsafe')
+            return out
         return src
-    # src = src.copy()
+
+    # Linear interpolation is separable, so it can be done one axis
+    # at a time without gathering every surrounding point.
+    if interpolator is lp.ndlerp:
+        maps = _map_axes_by_shape(src.shape, shape)
+        return _resize_by_axis(src, maps, dtype, out)
 
     # Map out the relationship between the old space and the
     # new space.
     a_index, b_index, x = build_resizing_matrices(src.shape, shape)
+
+    # If a datatype for the interpolation was given, the values and
+    # distances are converted before the interpolation.
+    src_dtype = src.dtype
+    if dtype is not None:
+        src = src.astype(dtype, copy=False)
+        x = x.astype(dtype, copy=False)
+
     a = _replace_indices_with_values(src, a_index)
     del a_index
     b = _replace_indices_with_values(src, b_index)
 
     # Perform the interpolation using the mapped space and return.
-    return interpolator(a, b, x)
-
-
-def trilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
+    result = interpolator(a, b, x)
+    if out is not None:
+        np.copyto(out, result, casting='unsafe')
+        return out
+    return result.astype(src_dtype, copy=False)
+
+
+def trilinear_interpolation(
+    a: ImgAry,
+    factor: float,
+    dtype: Optional[DTypeLike] = None
+) -> ImgAry:
     """Resize an three dimensional array using trilinear
     interpolation.
 
@@ -287,6 +245,11 @@ def trilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
         interpolation works, you probably don't get great results
         with factor less than or equal to .5. Consider multiple
         passes of interpolation with larger factors in those cases.
+    :param dtype: (Optional.) The datatype to perform the interpolation
+        in. Using :class:`numpy.float32` halves the memory used at
+        the cost of precision. The result is still returned in the
+        datatype of the original array. Defaults to the datatype of
+        the original array.
     :return: A :class:ndarray object.
     :rtype: numpy.ndarray
 
@@ -329,127 +292,100 @@ def trilinear_interpolation(a: ImgAry, factor: float) -> ImgAry:
     if factor == 1:
         return a
 
-    # Perform a defensive copy of the original array to avoid
-    # unexpected side effects.
-    a = a.copy()
+    # The original array is only read from, so it isn't copied.
+    src = a
+    if dtype is not None:
+        src = a.astype(dtype, copy=False)
+
+    # Each Z plane is resized along the Y and X axes independently of
+    # the others. NumPy releases the GIL while it does the work, so
+    # large planes are resized in parallel threads before the Z axis
+    # is interpolated between them.
+    resize_plane = partial(
+        _resize_by_factor,
+        factor=factor,
+        axes=(Y_, X_),
+        dtype=dtype
+    )
+    planes = [src[..., z, :, :] for z in range(src.shape[Z_])]
+    plane_size = src.shape[Y_] * src.shape[X_]
+    if (
+        _threads is not None
+        and len(planes) > 1
+        and plane_size >= _threaded_plane_size
+    ):
+        resized = list(_threads.map(resize_plane, planes))
+    else:
+        resized = [resize_plane(plane) for plane in planes]
+    result = _resize_by_factor(np.stack(resized, Z_), factor, (Z_,), dtype)
+    return result.astype(a.dtype, copy=False)
 
-    # Since we are magnifying the given array, the new array's shape
-    # will increase by the magnification factor.
-    mag_size = tuple(int(s * factor) for s in a.shape)
 
-    # Map out the relationship between the old space and the
-    # new space.
-    indices = np.indices(mag_size)
-    if factor > 1:
-        whole = (indices // factor).astype(int)
-        parts = (indices / factor - whole).astype(float)
-    else:
-        new_ends = [s - 1 for s in mag_size]
-        old_ends = [s - 1 for s in a.shape]
-        true_factors = [n / o for n, o in zip(new_ends, old_ends)]
-        for i in range(len(true_factors)):
-            if true_factors[i] == 0:
-                true_factors[i] = .5
-        whole = indices.copy()
-        parts = indices.copy()
-        for i in Z_, Y_, X_:
-            whole[i] = (indices[i] // true_factors[i]).astype(int)
-            parts[i] = (indices[i] / true_factors[i] - whole[i]).astype(float)
-    del indices
-
-    # Trilinear interpolation determines the value of a new pixel by
-    # comparing the values of the eight old pixels that surround it.
-    # The hashes are the keys to the dictionary that contains those
-    # old pixel values. The key indicates the position of the pixel
-    # on each axis, with one meaning the position is ahead of the
-    # new pixel, and zero meaning the position is behind it.
-    hashes = [f'{n:>03b}'[::-1] for n in range(2 ** 3)]
-    hash_table = {}
-
-    # The original array needs to be made one dimensional for the
-    # numpy.take operation that will occur as we build the tables.
-    raveled = np.ravel(a)
-
-    # Build the table that contains the old pixel values to
-    # interpolate.
-    for hash in hashes:
-        hash_whole = whole.copy()
-
-        # Use the hash key to adjust the which old pixel we are
-        # looking at.
-        for axis in Z_, Y_, X_:
-            if hash[axis] == '1':
-                hash_whole[axis] += 1
-
-                # Handle the pixels that were pushed off the far
-                # edge of the original array by giving them the
-                # value of the last pixel along that axis in the
-                # original array.
-                m = np.zeros(hash_whole[axis].shape, dtype=bool)
-                m[hash_whole[axis] >= a.shape[axis]] = True
-                hash_whole[axis][m] = a.shape[axis] - 1
-
-        # Since numpy.take() only works in one dimension, we need to
-        # map the three dimensional indices of the original array to
-        # the one dimensional indices used by the raveled version of
-        # that array.
-        raveled_indices = hash_whole[Z_] * a.shape[Y_] * a.shape[X_]
-        raveled_indices += hash_whole[Y_] * a.shape[X_]
-        raveled_indices += hash_whole[X_]
-
-        # Get the value of the pixel in the original array.
-        hash_table[hash] = np.take(raveled, raveled_indices.astype(int))
-
-    # Once the hash table has been built, clean up the working arrays
-    # in case we are running short on memory.
-    else:
-        del hash_whole, raveled_indices, whole
+# Private functions.
+def _build_relative_position_offsets(dimensions: int) -> IntAry64:
+    """Create the table of offsets from position 0 on each axis for
+    the different points used in an n-dimensional interpolation.
+    """
+    # The first axis is the most significant bit of the point number.
+    points = np.arange(2 ** dimensions)[:, None]
+    shifts = np.arange(dimensions - 1, -1, -1)
+    return (points >> shifts) & 1
 
-    # Everything before this was to set up the interpolation. Now that
-    # it's set up, we perform the interpolation. Since we are doing
-    # this across three dimensions, it's a three stage process. Stage
-    # one is along the X_ axis.
-    x1 = lp.lerp(hash_table['000'], hash_table['001'], parts[X_])
-    x2 = lp.lerp(hash_table['010'], hash_table['011'], parts[X_])
-    x3 = lp.lerp(hash_table['100'], hash_table['101'], parts[X_])
-    x4 = lp.lerp(hash_table['110'], hash_table['111'], parts[X_])
 
-    # Stage two is along the Y_ axis.
-    y1 = lp.lerp(x1, x2, parts[Y_])
-    y2 = lp.lerp(x3, x4, parts[Y_])
-    del x1, x2, x3, x4
+@lru_cache(maxsize=4)
+def _build_resizing_matrices(
+    src_shape: tuple[int, ...],
+    dst_shape: tuple[int, ...]
+) -> tuple[IntAry, IntAry, RatioAry]:
+    """Create and cache the indexing and distance arrays needed to
+    interpolate values when resizing an array. Only a few shapes are
+    cached, since the arrays are several times the size of the
+    resized array. Use :func:`build_resizing_matrices` rather than
+    calling this directly, so large shapes aren't cached.
+    """
+    # Interpolation guesses a value between known data values. To
+    # do this you need to know those points. The number of points
+    # surrounding the value being guessed is the square of the
+    # dimensions in the array.
+    num_dim = len(src_shape)
+
+    # The relative positions of the points compared to the interpolated
+    # value are coded by the bits of the point's number, where 1 is
+    # after the value on the axis and 0 is before the value. Those
+    # become a table of how far each point is offset from position 0
+    # on each axis.
+    offsets = _build_relative_position_offsets(num_dim)
+
+    # Positions that are before the value on the last axis go in one
+    # side of the resizing matrices and the positions after it go in
+    # the other. Grouping the offsets by side keeps each side in one
+    # contiguous block of memory.
+    offsets = np.concatenate((offsets[::2], offsets[1::2]))
+    offsets = offsets.astype(np.int32)
 
-    # And stage three is along the Z_ axis. Since this is the last step
-    # we can just return the result.
-    return lp.lerp(y1, y2, parts[Z_])
+    # Create the map for position 0, which is before the interpolated
+    # value on every axis.
+    factors = _get_resizing_factors(src_shape, dst_shape)
+    src_indices, x = _map_indices_and_distances(dst_shape, factors)
 
+    # Create the maps for all of the positions at once by broadcasting
+    # the offsets over the map for position 0. The values are then
+    # capped to the highest index in the original array.
+    spatial = (1,) * num_dim
+    indices = src_indices[None] + offsets.reshape((*offsets.shape, *spatial))
+    caps = np.array(src_shape, dtype=np.int32) - 1
+    np.minimum(indices, caps.reshape((1, num_dim, *spatial)), out=indices)
 
-# Private functions.
-def _build_relative_position_masks(dimensions: int) -> list[str]:
-    """Create the masks for identifying the different points used in
-    an n-dimensional interpolation.
-    """
-    points = range(2 ** dimensions)
-    mask_template = '{:>0' + str(dimensions) + 'b}'
-    mask = [mask_template.format(p)[::-1] for p in points]
-    return sorted(mask)
-
-
-def _calc_raveled_indices(
-    indices: IntAry,
-    src_shape: Size
-) -> IntAry:
-    """Convert indices for a multidimensional array to indices for
-    that array after it has been raveled.
-    """
-    axes = range(len(src_shape))
-    raveled_shape = (indices.shape[0], *indices.shape[2:])
-    raveled_indices = np.zeros(raveled_shape, dtype=int)
-    for axis in axes:
-        remaining_dims = src_shape[axis + 1:]
-        axis_mod = prod(remaining_dims)
-        raveled_indices += indices[:, axis] * axis_mod
-    return raveled_indices
+    # Split the maps into the two sides of the resizing matrices.
+    a, b = np.split(indices, 2)
+
+    # The arrays can be shared by every call with the same shapes, so
+    # they can't be allowed to change.
+    for matrix in a, b, x:
+        matrix.setflags(write=False)
+
+    # Return the arrays for the resizing interpolation.
+    return a, b, x
 
 
 def _get_resizing_factors(
@@ -469,38 +405,173 @@ def _get_resizing_factors(
 def _map_indices_and_distances(
     shape: Size,
     factors: tuple[float, ...]
-) -> tuple[RatioAry, RatioAry]:
+) -> tuple[IntAry32, RatioAry]:
     """Map the indices for the zero position array and the distances
     for the distance array for an array resizing interpolation.
     """
-    axes = range(len(shape))
-    indices = np.indices(shape, dtype=float)
-    for axis in axes:
-        indices[axis] /= factors[axis]
-    src_indices = np.trunc(indices)
-    distances = indices - src_indices
+    # The positions are never negative, so casting to an integer
+    # truncates them to the index of the point before them. The
+    # remainder is the distance, and it is calculated in place in
+    # the positions array. No axis of an image is long enough to
+    # need more than 32-bit indices, and the smaller indices halve
+    # the memory read when they are used to gather values.
+    spatial = (1,) * len(shape)
+    distances = np.indices(shape, dtype=float)
+    distances /= np.reshape(factors, (-1, *spatial))
+    src_indices = distances.astype(np.int32)
+    distances -= src_indices
     return src_indices, distances
 
 
+def _map_axis_by_factor(
+    length: int,
+    new_length: int,
+    factor: float
+) -> tuple[IntAry64, RatioAry]:
+    """Map the indices of an axis resized by a factor to the index
+    of the nearest point before it in the original axis and the
+    distance to that point.
+    """
+    # When shrinking, the ends of the new axis are pinned to the ends
+    # of the original axis, so the actual factor comes from the
+    # distance between the ends.
+    if factor < 1:
+        factor = (new_length - 1) / (length - 1)
+        if factor == 0:
+            factor = .5
+
+    indices = np.arange(new_length)
+    whole = (indices // factor).astype(int)
+    parts = indices / factor - whole
+    return whole, parts
+
+
+def _map_axes_by_shape(
+    src_shape: Size,
+    dst_shape: Size
+) -> list[tuple[int, IntAry64, RatioAry]]:
+    """Map the indices of each axis of a resized array to the index
+    of the nearest point before it in the original axis and the
+    distance to that point, starting with the last axis. This maps
+    the same points as :func:`build_resizing_matrices`. Axes that
+    don't change length aren't mapped, since interpolating along
+    them wouldn't change the values.
+    """
+    maps = []
+    factors = _get_resizing_factors(src_shape, dst_shape)
+    for axis in range(-1, -len(src_shape) - 1, -1):
+        if src_shape[axis] == dst_shape[axis]:
+            continue
+        parts = np.arange(dst_shape[axis], dtype=float)
+        parts /= factors[axis]
+        whole = parts.astype(int)
+        parts -= whole
+        np.minimum(whole, src_shape[axis] - 1, out=whole)
+        maps.append((axis, whole, parts))
+    return maps
+
+
 def _replace_indices_with_values(
     src: NumAry,
     indices: IntAry
 ) -> NumAry:
     """Replace the indices in an array with values from another array."""
-    # numpy.take only works in one dimension. We'll need to
-    # ravel the original array to be able to get the values, but
-    # we still need the original shape to calculate the new indices.
-    src_shape = src.shape
-    raveled = np.ravel(src)
+    # The second axis of the indices holds the index on each axis of
+    # the original array, so splitting along it gives the index arrays
+    # needed to get the values with fancy indexing.
+    return src[tuple(indices[:, axis] for axis in range(src.ndim))]
 
-    # Calculate the raveled indices for each dimension.
-    raveled_indices = _calc_raveled_indices(indices, src_shape)
 
-    # Return the values from the original array.
-    result = np.take(raveled, raveled_indices.astype(int))
+def _resize_by_axis(
+    a: NumAry,
+    maps: list[tuple[int, IntAry64, RatioAry]],
+    dtype: Optional[DTypeLike] = None,
+    out: Optional[NumAry] = None
+) -> NumAry:
+    """Resize an array with linear interpolation one axis at a time.
+    Each map is the axis to resize, the index of the point before each
+    new point on that axis, and the distance to that point. If given,
+    the resized array is stored in `out`.
+    """
+    # If a datatype for the interpolation was given, the values are
+    # converted to it before interpolating. The distances will be
+    # converted to it as they are used.
+    result = a
+    if dtype is not None:
+        result = a.astype(dtype, copy=False)
+
+    # Linear interpolation is separable. Rather than gathering every
+    # point surrounding each new point at the full new size, the
+    # array is interpolated along one axis at a time. Each pass only
+    # needs the index and distance of the points along that one axis.
+    last = len(maps) - 1
+    for i, (axis, whole, parts) in enumerate(maps):
+        # When every new point lands on a point in the original array,
+        # such as when shrinking by an integer factor, the values only
+        # need to be gathered from the original points.
+        if not parts.any():
+            result = np.take(result, whole, axis)
+            continue
+
+        # Handle the points that were pushed off the far edge of the
+        # original array by giving them the value of the last point
+        # along that axis in the original array.
+        ahead = np.minimum(whole + 1, a.shape[axis] - 1)
+
+        # The distances need to broadcast along the axis being
+        # interpolated, which is counted from the end of the shape.
+        parts = parts.reshape((-1,) + (1,) * (-axis - 1))
+        if dtype is not None:
+            parts = parts.astype(dtype)
+
+        # The points ahead are only needed for this pass, so the
+        # interpolation is stored in their array rather than a new one
+        # if it can hold the interpolated values. On the last pass,
+        # the points ahead are gathered into the given output array
+        # if it has the datatype of the interpolation.
+        behind = np.take(result, whole, axis)
+        result_dtype = np.result_type(result, parts)
+        if (
+            i == last
+            and out is not None
+            and out.dtype == result.dtype == result_dtype
+        ):
+            ahead = np.take(result, ahead, axis, out=out, mode='clip')
+        else:
+            ahead = np.take(result, ahead, axis)
+        dest = None
+        if ahead.dtype == result_dtype:
+            dest = ahead
+        result = lp.lerp(behind, ahead, parts, out=dest)
+
+    # Copy the result into the output array if it couldn't be stored
+    # there directly.
+    if result is not out:
+        result = result.astype(a.dtype, copy=False)
+        if out is not None:
+            np.copyto(out, result, casting='unsafe')
+            result = out
     return result
 
 
+def _resize_by_factor(
+    a: ImgAry,
+    factor: float,
+    axes: tuple[int, ...],
+    dtype: Optional[DTypeLike] = None
+) -> ImgAry:
+    """Resize an array by a factor with linear interpolation along
+    each of the given axes, starting with the last.
+    """
+    maps = []
+    for axis in reversed(axes):
+        length = a.shape[axis]
+        new_length = int(length * factor)
+        whole, parts = _map_axis_by_factor(length, new_length, factor)
+        maps.append((axis, whole, parts))
+    return _resize_by_axis(a, maps, dtype)
+
+
 if __name__ == '__main__':
     from pjimg.util.debug import print_array
     
@@ -7,21 +7,25 @@ General utility functions for :mod:`pjimg`.
 .. autofunction:: pjimg.util.find_center
 .. autofunction:: pjimg.util.get_free_rotation_size_2d
 .. autofunction:: pjimg.util.translate_by_polar_coords
+.. autofunction:: pjimg.util.translate_by_polar_coords_batch
 
 """
 import math
+from functools import lru_cache
 from inspect import getmembers, isfunction
 from typing import Callable
 
 import numpy as np
+from numpy.typing import NDArray
 
 from pjimg.util.constants import X, Y, Z
-from pjimg.util.model import Size, Loc
+from pjimg.util.model import ArrayLike, Size, Loc
 
 
 # Exported names.
 __all__ = [
-    'find_center', 'get_free_rotation_size_2d', 'translate_by_polar_coords'
+    'find_center', 'get_free_rotation_size_2d', 'translate_by_polar_coords',
+    'translate_by_polar_coords_batch',
 ]
 
 
@@ -35,6 +39,12 @@ def find_center(size: Size, loc: Loc = (0, 0, 0)) -> Size:
     :return: A :class:`tuple` with the center location of the image.
     :rtype: tuple
     """
+    # Most sizes are three dimensional, and unpacking them directly
+    # avoids the overhead of building the list.
+    if len(size) == 3 and len(loc) == 3:
+        z, y, x = size
+        oz, oy, ox = loc
+        return z // 2 + oz, y // 2 + oy, x // 2 + ox
     return tuple([n // 2 + o for n, o in zip(size, loc)])
 
 
@@ -55,9 +65,11 @@ def get_free_rotation_size_2d(
         data.
     :rtype: tuple
     """
+    # The image data has to reach the corners of the final image at
+    # every angle, so its radius is the distance from the pivot to a
+    # corner, which is the hypotenuse of the height and width.
     _, h, w = [n / 2 + abs(o) for n, o in zip(size, pivot_offset)]
-    o = math.atan(h / w)
-    d = 2 * int(h // math.sin(o)) + 1
+    d = 2 * int(math.hypot(h, w)) + 1
     return (size[Z], d, d)
 
 
@@ -76,24 +88,71 @@ def translate_by_polar_coords(
     :return: A :class:`tuple` with the final coordinates.
     :rtype: tuple
     """
+    # The math module is used for single values because it avoids the
+    # overhead of NumPy's array handling.
     y, x = 0, 1
     return (
-        start[y] + p * np.sin(o),
-        start[x] + p * np.cos(o),
+        start[y] + p * math.sin(o),
+        start[x] + p * math.cos(o),
     )
 
 
+def translate_by_polar_coords_batch(
+    start: ArrayLike,
+    p: ArrayLike,
+    o: ArrayLike
+) -> tuple[NDArray[np.float_], NDArray[np.float_]]:
+    """Given two-dimensional locations in linear coordinates and
+    distances in polar coordinates, return the linear coordinates
+    of the locations those distances away from the original locations.
+    The locations, rhos, and thetas are broadcast against each other.
+
+    :param start: The starting locations, with the Y and X coordinates
+        in the last axis.
+    :param p: The rhos (distances) of the polar coordinates.
+    :param o: The thetas (angles) of the polar coordinates in radians.
+    :return: A :class:`tuple` with arrays of the final Y and X
+        coordinates.
+    :rtype: tuple
+    """
+    y, x = 0, 1
+    start = np.asarray(start, dtype=float)
+    shape = np.broadcast_shapes(start.shape[:-1], np.shape(p), np.shape(o))
+    ys = np.sin(o, out=np.empty(shape, dtype=float))
+    ys *= p
+    ys += start[..., y]
+    xs = np.cos(o, out=np.empty(shape, dtype=float))
+    xs *= p
+    xs += start[..., x]
+    return ys, xs
+
+
 # Functions.
 def get_prefixed_functions(prefix: str, obj: object) -> dict[str, Callable]:
     """Return the functions within the given object that start with
-    the prefix.
+    the prefix. The functions are gathered once for each prefix and
+    object, so functions added to the object later won't be returned.
     
     :param prefix: The prefix of the functions to gather.
     :param obj: The module to gather from.
     :return: A :class:`dict` of the gathered functions.
     :rtype: dict
     """
+    return dict(_gather_prefixed_functions(prefix, obj))
+
+
+# Private functions.
+@lru_cache(maxsize=32)
+def _gather_prefixed_functions(
+    prefix: str,
+    obj: object
+) -> tuple[tuple[str, Callable], ...]:
+    """Gather and cache the functions within the given object that
+    start with the prefix. They are cached as a tuple, so they can't
+    be changed by the callers.
+    """
     names = getmembers(obj, isfunction)
     p_len = len(prefix)
-    fns = {name[p_len:]: fn for name, fn in names if name.startswith(prefix)}
-    return dict(fns)
+    return tuple(
+        (name[p_len:], fn) for name, fn in names if name.startswith(prefix)
+    )
@@ -10,3 +10,13 @@ import numpy as np
 # Utility functions.
 def mkhex(a):
     return (a * 0xff).astype(np.uint8)
+
+
+def assert_close(a, expected):
+    """Assert an array has the expected shape and its values round
+    to the expected values at four decimal places.
+    """
+    # Some results, like 0.09375, fall exactly halfway between two
+    # four place values, so the tolerance has to allow a little more
+    # than half of the last place.
+    np.testing.assert_allclose(a, expected, rtol=0, atol=5.0001e-5)
@@ -0,0 +1,39 @@
+"""
+conftest
+~~~~~~~~
+
+Configuration for the test suite.
+"""
+from importlib.util import find_spec
+
+import pytest as pt
+
+
+# Command line options.
+def pytest_addoption(parser):
+    """Add the option to time the operations under test."""
+    parser.addoption(
+        '--bench',
+        action='store_true',
+        help='Time the blends and eases with pytest-benchmark.'
+    )
+
+
+@pt.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Fail early if timing was requested without pytest-benchmark.
+    Otherwise, warm up each case before timing it unless the warmup
+    was set on the command line.
+    """
+    if not config.getoption('bench'):
+        return
+    if find_spec('pytest_benchmark') is None:
+        msg = '--bench requires pytest-benchmark to be installed.'
+        raise pt.UsageError(msg)
+
+    # The warmup is set here rather than by the caller, since pytest
+    # rejects the pytest-benchmark options when it isn't installed
+    # before the check above could explain why.
+    args = config.invocation_params.args
+    if not any(arg.startswith('--benchmark-warmup') for arg in args):
+        config.option.benchmark_warmup = True
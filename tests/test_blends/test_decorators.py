@@ -35,7 +35,7 @@ class TestCanFade:
             return b
 
         result = spam(a, b, 0.5)
-        assert (np.around(result, 4) == np.array([
+        assert np.array_equal(np.around(result, 4), np.array([
             [
                 [0.5, 0.5, 0.5, 0.5, 0.5,],
                 [0.5, 0.5, 0.5, 0.5, 0.5,],
@@ -43,7 +43,7 @@ class TestCanFade:
                 [0.5, 0.5, 0.5, 0.5, 0.5,],
                 [0.5, 0.5, 0.5, 0.5, 0.5,],
             ],
-        ], dtype=float)).all()
+        ], dtype=float))
 
     def test_no_fades(self, a, b):
         """If no fade is passed, :func:`can_fade` should not change the
@@ -54,7 +54,7 @@ class TestCanFade:
             return b
 
         result = spam(a, b)
-        assert (np.around(result, 4) == b).all()
+        assert np.array_equal(np.around(result, 4), b)
 
 
 class TestCanMask:
@@ -78,7 +78,7 @@ class TestCanMask:
             ],
         ], dtype=float)
         result = spam(b, a, mask)
-        assert (np.around(result, 4) == np.array([
+        assert np.array_equal(np.around(result, 4), np.array([
             [
                 [0.00, 0.00, 0.00, 0.00, 0.00,],
                 [0.25, 0.25, 0.25, 0.25, 0.25,],
@@ -86,7 +86,7 @@ class TestCanMask:
                 [0.75, 0.75, 0.75, 0.75, 0.75,],
                 [1.00, 1.00, 1.00, 1.00, 1.00,],
             ],
-        ], dtype=float)).all()
+        ], dtype=float))
 
     def test_no_mask(self, a, b):
         """If no mask is passed, :func:`can_mask` should not change the
@@ -97,7 +97,7 @@ class TestCanMask:
             return b
 
         result = spam(b, a)
-        assert (np.around(result, 4) == a).all()
+        assert np.array_equal(np.around(result, 4), a)
 
 
 class TestWillClip:
@@ -130,7 +130,7 @@ class TestWillClip:
             ],
         ], dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == np.array([
+        assert np.array_equal(np.around(result, 4), np.array([
             [
                 [0.0, 0.0, 0.5, 1.0, 1.0,],
                 [0.0, 0.0, 0.5, 1.0, 1.0,],
@@ -138,7 +138,7 @@ class TestWillClip:
                 [0.0, 0.0, 0.5, 1.0, 1.0,],
                 [0.0, 0.0, 0.5, 1.0, 1.0,],
             ]
-        ], dtype=float)).all()
+        ], dtype=float))
 
 
 class TestWillColorize:
@@ -153,9 +153,9 @@ class TestWillColorize:
         a = np.zeros((1, 5, 5), dtype=float)
         b = np.ones((1, 5, 5, 3), dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == np.zeros(
+        assert np.array_equal(np.around(result, 4), np.zeros(
             (1, 5, 5, 3), dtype=float
-        )).all()
+        ))
 
     def test_colorize_b(self):
         """Given an RGB image and a grayscale image, :func:`will_colorize`
@@ -168,9 +168,9 @@ class TestWillColorize:
         a = np.zeros((1, 5, 5, 3), dtype=float)
         b = np.ones((1, 5, 5), dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == np.ones(
+        assert np.array_equal(np.around(result, 4), np.ones(
             (1, 5, 5, 3), dtype=float
-        )).all()
+        ))
 
     def test_no_effect_when_both_grayscale(self):
         """If both images only have one channel, :func:`will_colorize`
@@ -183,7 +183,7 @@ class TestWillColorize:
         a = np.zeros((1, 5, 5), dtype=float)
         b = np.ones((1, 5, 5), dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == b).all()
+        assert np.array_equal(np.around(result, 4), b)
 
     def test_no_effect_when_both_rgb(self):
         """If both images have three channels, :func:`will_colorize`
@@ -196,7 +196,7 @@ class TestWillColorize:
         a = np.zeros((1, 5, 5, 3), dtype=float)
         b = np.ones((1, 5, 5, 3), dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == b).all()
+        assert np.array_equal(np.around(result, 4), b)
 
     def test_no_effect_when_off(self):
         """If colorize is given `False`, :func:`will_colorize`
@@ -209,7 +209,7 @@ class TestWillColorize:
         a = np.zeros((1, 5, 5, 3), dtype=float)
         b = np.ones((1, 5, 5), dtype=float)
         result = spam(a, b, colorize=False)
-        assert (np.around(result, 4) == b).all()
+        assert np.array_equal(np.around(result, 4), b)
 
 
 class TestWillMatchSize:
@@ -243,7 +243,7 @@ class TestWillMatchSize:
             ],
         ], dtype=float)
         result = spam(a, b)
-        assert (np.around(result, 4) == np.array([
+        assert np.array_equal(np.around(result, 4), np.array([
             [
                 [0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.5,],
                 [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 0.0,],
@@ -253,4 +253,4 @@ class TestWillMatchSize:
                 [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 0.0,],
                 [0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.5,],
             ]
-        ], dtype=float)).all()
+        ], dtype=float))
@@ -11,7 +11,7 @@ import pjimg.eases.decorators as u
 
 
 # fixtures.
-@pt.fixture
+@pt.fixture(scope='module')
 def decorated():
     """A decorated function for testing."""
     @u.will_scale
@@ -35,7 +35,7 @@ def test_will_scale(decorated):
             [2.0, 2.5, 3.0, 3.5, 4.0,],
         ],
     ], dtype=float)
-    assert (decorated(a) == np.array([
+    assert np.array_equal(decorated(a), np.array([
         [
             [2.00, 2.25, 2.50, 2.75, 3.00,],
             [2.00, 2.25, 2.50, 2.75, 3.00,],
@@ -43,7 +43,7 @@ def test_will_scale(decorated):
             [2.00, 2.25, 2.50, 2.75, 3.00,],
             [2.00, 2.25, 2.50, 2.75, 3.00,],
         ],
-    ], dtype=float)).all()
+    ], dtype=float))
 
 
 def test_will_scale_no_scale(decorated):
@@ -57,10 +57,10 @@ def test_will_scale_no_scale(decorated):
             [0.25, 0.50, 0.75, ],
         ],
     ], dtype=float)
-    assert (decorated(a) == np.array([
+    assert np.array_equal(decorated(a), np.array([
         [
             [0.1250, 0.2500, 0.3750, ],
             [0.1250, 0.2500, 0.3750, ],
             [0.1250, 0.2500, 0.3750, ],
         ],
-    ], dtype=float)).all()
+    ], dtype=float))
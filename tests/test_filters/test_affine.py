@@ -8,37 +8,104 @@ import numpy as np
 import pytest as pt
 
 import pjimg.filters.affine as f
+from tests.common import assert_close
 from tests.fixtures import *
 
 
+# Expected results.
+_FLIP = np.array([
+    [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
+    [0.7500, 1.0000, 0.7500, 0.5000, 0.2500],
+    [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
+    [0.2500, 0.5000, 0.7500, 1.0000, 0.7500],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+], dtype=float)
+# Flipping the video on the Z axis swaps its frames, and the second
+# frame of the video is the first frame flipped vertically.
+_FLIP_VIDEO = np.stack((_FLIP, _FLIP[::-1]))
+_GROW = np.array([
+    [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
+    [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
+    [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
+    [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
+], dtype=float)
+_GROW_VIDEO = np.stack((_GROW,) * 4)
+_ROTATE_2D = np.array([
+    [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
+    [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
+    [0.2969, 0.6406, 1.0000, 0.6406, 0.2969],
+    [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
+    [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
+], dtype=float)
+_ROTATE_2D_VIDEO = np.stack((
+    _ROTATE_2D,
+    np.array([
+        [0.0938, 0.2803, 0.2969, 0.2803, 0.0781],
+        [0.5947, 0.6484, 0.6406, 0.6484, 0.5947],
+        [0.8794, 0.8989, 1.0000, 0.8989, 0.8794],
+        [0.5947, 0.6484, 0.6406, 0.6484, 0.5947],
+        [0.0938, 0.2803, 0.2969, 0.2803, 0.0781],
+    ], dtype=float),
+))
+_ROTATE_2D_ORIGIN = np.array([
+    [0.1484, 0.5000, 0.8516, 0.7891, 0.4375],
+    [0.1406, 0.5000, 0.8594, 0.7969, 0.4375],
+    [0.1484, 0.5000, 0.8516, 0.7891, 0.4375],
+    [0.0000, 0.3572, 0.8340, 0.7891, 0.2673],
+    [0.0000, 0.0000, 0.5706, 0.4358, 0.0000],
+], dtype=float)
+_ROTATE_90 = np.array([
+    [
+        [0.8000, 0.6000, 0.4000, 0.2000, 0.0000],
+        [0.9000, 0.7000, 0.5000, 0.3000, 0.1000],
+        [1.0000, 0.8000, 0.6000, 0.4000, 0.2000],
+        [0.7000, 0.9000, 0.7000, 0.5000, 0.3000],
+        [0.8000, 1.0000, 0.8000, 0.6000, 0.4000],
+    ],
+], dtype=float)
+_ROTATE_90_CCW = np.array([
+    [
+        [0.4000, 0.6000, 0.8000, 1.0000, 0.8000],
+        [0.3000, 0.5000, 0.7000, 0.9000, 0.7000],
+        [0.2000, 0.4000, 0.6000, 0.8000, 1.0000],
+        [0.1000, 0.3000, 0.5000, 0.7000, 0.9000],
+        [0.0000, 0.2000, 0.4000, 0.6000, 0.8000],
+    ],
+], dtype=float)
+_SKEW = np.array([
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [1.0000, 0.7500, 0.2500, 0.5000, 0.7500],
+    [0.7500, 1.0000, 0.7500, 0.5000, 0.5000],
+    [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
+    [0.5000, 0.2500, 0.0000, 1.0000, 0.7500],
+], dtype=float)
+_SKEW_VIDEO = np.stack((
+    _SKEW,
+    np.array([
+        [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
+        [0.5000, 0.2500, 0.7500, 1.0000, 0.7500],
+        [0.7500, 1.0000, 0.7500, 0.5000, 0.5000],
+        [0.7500, 0.2500, 0.5000, 0.7500, 1.0000],
+        [0.5000, 0.7500, 1.0000, 0.0000, 0.2500],
+    ], dtype=float),
+))
+
+
 # Test cases.
 class TestFlip:
-    def test_x_axis(self, a):
-        """Given image data and an axis, :func:`flip` flip the
-        image around that axis.
-        """
-        result = f.flip(a, axis=f.X_)
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-            [0.7500, 1.0000, 0.7500, 0.5000, 0.2500],
-            [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
-            [0.2500, 0.5000, 0.7500, 1.0000, 0.7500],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-        ], dtype=float)).all()
-
-    def test_y_axis(self, a):
+    @pt.mark.parametrize('axis', (
+        pt.param(f.X_, id='x'),
+        pt.param(f.Y, id='y'),
+    ))
+    def test_axis(self, a, axis):
         """Given image data and an axis, :func:`flip` flip the
-        image around that axis. If the axis is the Y axis, the flip
-        happens around the Y axis.
+        image around that axis. The image data is symmetric, so
+        flipping around the X or Y axis gives the same result.
         """
-        result = f.flip(a, axis=f.Y)
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-            [0.7500, 1.0000, 0.7500, 0.5000, 0.2500],
-            [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
-            [0.2500, 0.5000, 0.7500, 1.0000, 0.7500],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-        ], dtype=float)).all()
+        result = f.flip(a, axis=axis)
+        assert_close(result, _FLIP)
 
     def test_z_axis(self, video_2_5_5):
         """Given image data and an axis, :func:`flip` flip the
@@ -46,22 +113,7 @@ class TestFlip:
         happens around the Z axis.
         """
         result = f.flip(video_2_5_5, axis=f.Z)
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-                [0.7500, 1.0000, 0.7500, 0.5000, 0.2500],
-                [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
-                [0.2500, 0.5000, 0.7500, 1.0000, 0.7500],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            ],
-            [
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-                [0.2500, 0.5000, 0.7500, 1.0000, 0.7500],
-                [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
-                [0.7500, 1.0000, 0.7500, 0.5000, 0.2500],
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _FLIP_VIDEO)
 
 
 class TestFilterGrow:
@@ -70,54 +122,14 @@ class TestFilterGrow:
         should zoom into the image by the size factor.
         """
         result = f.grow(video_2_3_3, factor=2)
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
-                [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
-                [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
-                [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-            ],
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
-                [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
-                [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
-                [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-            ],
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
-                [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
-                [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
-                [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-            ],
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
-                [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
-                [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
-                [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _GROW_VIDEO)
 
     def test_image(self, image_1_3_3):
         """Given image data and a size factor, zoom into the image
         by the size factor. This should work on still image data.
         """
         result = f.grow(image_1_3_3, factor=2)
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.7500, 0.5000, 0.2500, 0.0000, 0.0000],
-            [0.7500, 0.5000, 0.2500, 0.2500, 0.2500, 0.2500],
-            [0.5000, 0.2500, 0.0000, 0.2500, 0.5000, 0.5000],
-            [0.2500, 0.2500, 0.2500, 0.5000, 0.7500, 0.7500],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000, 1.0000],
-        ], dtype=float)).all()
+        assert_close(result, _GROW)
 
 
 class TestRotate2d:
@@ -127,15 +139,7 @@ class TestRotate2d:
         clockwise direction.
         """
         result = f.rotate_2d(a, 45.0)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
-                [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
-                [0.2969, 0.6406, 1.0000, 0.6406, 0.2969],
-                [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
-                [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _ROTATE_2D)
 
     def test_filter_origin(self, a):
         """Given image data and an angle, :func:`rotate_2d`
@@ -144,15 +148,7 @@ class TestRotate2d:
         image should be rotated around that point.
         """
         result = f.rotate_2d(a, 45.0, origin=(1, 1))
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.1484, 0.5000, 0.8516, 0.7891, 0.4375],
-                [0.1406, 0.5000, 0.8594, 0.7969, 0.4375],
-                [0.1484, 0.5000, 0.8516, 0.7891, 0.4375],
-                [0.0000, 0.3572, 0.8340, 0.7891, 0.2673],
-                [0.0000, 0.0000, 0.5706, 0.4358, 0.0000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _ROTATE_2D_ORIGIN)
 
     def test_filter_video(self, video_2_5_5):
         """Given image data and an angle, :func:`rotate_2d`
@@ -161,24 +157,7 @@ class TestRotate2d:
         of the data should be rotated.
         """
         result = f.rotate_2d(video_2_5_5, 45.0)
-        assert (np.around(result, 4) == np.array([
-            [
-                [
-                    [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
-                    [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
-                    [0.2969, 0.6406, 1.0000, 0.6406, 0.2969],
-                    [0.2803, 0.6484, 0.8989, 0.6484, 0.2803],
-                    [0.0938, 0.5947, 0.8794, 0.5947, 0.0781],
-                ],
-                [
-                    [0.0938, 0.2803, 0.2969, 0.2803, 0.0781],
-                    [0.5947, 0.6484, 0.6406, 0.6484, 0.5947],
-                    [0.8794, 0.8989, 1.0000, 0.8989, 0.8794],
-                    [0.5947, 0.6484, 0.6406, 0.6484, 0.5947],
-                    [0.0938, 0.2803, 0.2969, 0.2803, 0.0781],
-                ],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _ROTATE_2D_VIDEO)
 
 
 class TestRotate90:
@@ -187,65 +166,25 @@ class TestRotate90:
         should rotate the image data 90° in that direction.
         """
         result = f.rotate_90(image_5_5_tenths)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.8000, 0.6000, 0.4000, 0.2000, 0.0000],
-                [0.9000, 0.7000, 0.5000, 0.3000, 0.1000],
-                [1.0000, 0.8000, 0.6000, 0.4000, 0.2000],
-                [0.7000, 0.9000, 0.7000, 0.5000, 0.3000],
-                [0.8000, 1.0000, 0.8000, 0.6000, 0.4000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _ROTATE_90)
 
     def test_ccw(self, image_5_5_tenths):
         """Given image data and a direction, :func:`rotate_90`
         rotate the image data 90° in that direction.
         """
         result = f.rotate_90(image_5_5_tenths, direction='ccw')
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.4000, 0.6000, 0.8000, 1.0000, 0.8000],
-                [0.3000, 0.5000, 0.7000, 0.9000, 0.7000],
-                [0.2000, 0.4000, 0.6000, 0.8000, 1.0000],
-                [0.1000, 0.3000, 0.5000, 0.7000, 0.9000],
-                [0.0000, 0.2000, 0.4000, 0.6000, 0.8000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _ROTATE_90_CCW)
 
 
 class TestSkew:
-    def test_filter(self, a):
-        """Given image data and a slope, :func:`skew` should
-        skew the image data by an amount equal to the slope.
-        """
-        result = f.skew(a, slope=2.0)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [1.0000, 0.7500, 0.2500, 0.5000, 0.7500],
-            [0.7500, 1.0000, 0.7500, 0.5000, 0.5000],
-            [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
-            [0.5000, 0.2500, 0.0000, 1.0000, 0.7500],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _SKEW, id='image'),
+        pt.param('video_2_5_5', _SKEW_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data and a slope, :func:`skew` should
         skew the image data by an amount equal to the slope. This
         should also work for video.
         """
-        result = f.skew(video_2_5_5, slope=2.0)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-                [1.0000, 0.7500, 0.2500, 0.5000, 0.7500],
-                [0.7500, 1.0000, 0.7500, 0.5000, 0.5000],
-                [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
-                [0.5000, 0.2500, 0.0000, 1.0000, 0.7500],
-            ],
-            [
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-                [0.5000, 0.2500, 0.7500, 1.0000, 0.7500],
-                [0.7500, 1.0000, 0.7500, 0.5000, 0.5000],
-                [0.7500, 0.2500, 0.5000, 0.7500, 1.0000],
-                [0.5000, 0.7500, 1.0000, 0.0000, 0.2500],
-            ],
-        ], dtype=float)).all()
+        result = f.skew(request.getfixturevalue(src), slope=2.0)
+        assert_close(result, expected)
@@ -8,82 +8,100 @@ import numpy as np
 import pytest as pt
 
 import pjimg.filters.blurs as f
+from tests.common import assert_close
 from tests.fixtures import a, video_2_5_5
 
 
+# Expected results.
+_BOX_BLUR = np.array([
+    [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
+    [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
+    [0.5000, 0.5000, 0.7500, 0.8750, 0.7500],
+    [0.7500, 0.7500, 0.8750, 0.7500, 0.5000],
+    [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
+], dtype=float)
+_BOX_BLUR_VIDEO = np.stack((
+    _BOX_BLUR,
+    np.array([
+        [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
+        [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
+        [0.7500, 0.7500, 0.8750, 0.7500, 0.5000],
+        [0.5000, 0.5000, 0.7500, 0.8750, 0.7500],
+        [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
+    ], dtype=float),
+))
+_GAUSSIAN_BLUR = np.array([
+    [0.1070, 0.3036, 0.5534, 0.7918, 0.9158],
+    [0.3036, 0.5002, 0.7442, 0.9046, 0.7918],
+    [0.5534, 0.7442, 0.9044, 0.7442, 0.5534],
+    [0.7918, 0.9046, 0.7442, 0.5002, 0.3036],
+    [0.9158, 0.7918, 0.5534, 0.3036, 0.1070],
+], dtype=float)
+# The second frame of the video is the first frame flipped vertically.
+# A gaussian blur is symmetric, so the second frame of the result is
+# the first frame of the result flipped vertically.
+_GAUSSIAN_BLUR_VIDEO = np.stack((_GAUSSIAN_BLUR, _GAUSSIAN_BLUR[::-1]))
+_GLOW = np.array([
+    [
+        [0.7802, 0.8597, 0.9389, 0.9813, 1.0000],
+        [0.8597, 0.9211, 0.9736, 1.0000, 0.9813],
+        [0.9389, 0.9736, 1.0000, 0.9736, 0.9389],
+        [0.9813, 1.0000, 0.9736, 0.9211, 0.8597],
+        [1.0000, 0.9813, 0.9389, 0.8597, 0.7802],
+    ],
+    [
+        [1.0000, 0.9813, 0.9389, 0.8597, 0.7802],
+        [0.9813, 1.0000, 0.9736, 0.9211, 0.8597],
+        [0.9389, 0.9736, 1.0000, 0.9736, 0.9389],
+        [0.8597, 0.9211, 0.9736, 1.0000, 0.9813],
+        [0.7802, 0.8597, 0.9389, 0.9813, 1.0000],
+    ],
+], dtype=float)
+_MOTION_BLUR = np.array([
+    [0.1250, 0.1250, 0.3750, 0.6250, 0.8750],
+    [0.3750, 0.3750, 0.6250, 0.8750, 0.8750],
+    [0.6250, 0.6250, 0.8750, 0.8750, 0.6250],
+    [0.8750, 0.8750, 0.8750, 0.6250, 0.3750],
+    [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
+], dtype=float)
+# A horizontal motion blur also isn't changed by a vertical flip.
+_MOTION_BLUR_VIDEO = np.stack((_MOTION_BLUR, _MOTION_BLUR[::-1]))
+_MOTION_BLUR_VERTICAL = np.array([
+    [0.1250, 0.3750, 0.6250, 0.8750, 0.8750],
+    [0.1250, 0.3750, 0.6250, 0.8750, 0.8750],
+    [0.3750, 0.6250, 0.8750, 0.8750, 0.6250],
+    [0.6250, 0.8750, 0.8750, 0.6250, 0.3750],
+    [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
+], dtype=float)
+
+
 # Test cases.
 class TestBoxBlur:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _BOX_BLUR, id='image'),
+        pt.param('video_2_5_5', _BOX_BLUR_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data and a box size, :func:`box_blur`
-         perform a box blur on the image data.
-        """
-        result = f.box_blur(a, size=2)
-        assert (np.around(result, 4) == np.array([
-            [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
-            [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
-            [0.5000, 0.5000, 0.7500, 0.8750, 0.7500],
-            [0.7500, 0.7500, 0.8750, 0.7500, 0.5000],
-            [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given three dimensional image data, :func:`box_blur`
-        the blur should be performed on all frames of the image data.
+        should perform a box blur on the image data. If given video
+        data, the blur should be performed on all frames.
         """
-        result = f.box_blur(video_2_5_5, size=2)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
-                [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
-                [0.5000, 0.5000, 0.7500, 0.8750, 0.7500],
-                [0.7500, 0.7500, 0.8750, 0.7500, 0.5000],
-                [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
-            ],
-            [
-                [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
-                [0.8750, 0.8750, 0.7500, 0.5000, 0.2500],
-                [0.7500, 0.7500, 0.8750, 0.7500, 0.5000],
-                [0.5000, 0.5000, 0.7500, 0.8750, 0.7500],
-                [0.2500, 0.2500, 0.5000, 0.7500, 0.8750],
-            ],
-        ], dtype=float)).all()
+        result = f.box_blur(request.getfixturevalue(src), size=2)
+        assert_close(result, expected)
 
 
 class TestFilterGaussianBlue:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _GAUSSIAN_BLUR, id='image'),
+        pt.param('video_2_5_5', _GAUSSIAN_BLUR_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data and a sigma, :func:`gaussian_blur`
-        should perform a gaussian blur on the image data.
+        should perform a gaussian blur on the image data. If given
+        video data, the blur should be performed on all frames.
         """
-        result = f.gaussian_blur(a, sigma=0.5)
-        assert (np.around(result, 4) == np.array([
-            [0.1070, 0.3036, 0.5534, 0.7918, 0.9158],
-            [0.3036, 0.5002, 0.7442, 0.9046, 0.7918],
-            [0.5534, 0.7442, 0.9044, 0.7442, 0.5534],
-            [0.7918, 0.9046, 0.7442, 0.5002, 0.3036],
-            [0.9158, 0.7918, 0.5534, 0.3036, 0.1070],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given image data and a sigma, :func:`gaussian_blur`
-        should perform a gaussian blur on the image data.
-        """
-        result = f.gaussian_blur(video_2_5_5, sigma=0.5)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.1070, 0.3036, 0.5534, 0.7918, 0.9158],
-                [0.3036, 0.5002, 0.7442, 0.9046, 0.7918],
-                [0.5534, 0.7442, 0.9044, 0.7442, 0.5534],
-                [0.7918, 0.9046, 0.7442, 0.5002, 0.3036],
-                [0.9158, 0.7918, 0.5534, 0.3036, 0.1070],
-            ],
-            [
-                [0.9158, 0.7918, 0.5534, 0.3036, 0.1070],
-                [0.7918, 0.9046, 0.7442, 0.5002, 0.3036],
-                [0.5534, 0.7442, 0.9044, 0.7442, 0.5534],
-                [0.3036, 0.5002, 0.7442, 0.9046, 0.7918],
-                [0.1070, 0.3036, 0.5534, 0.7918, 0.9158],
-            ],
-        ], dtype=float)).all()
+        result = f.gaussian_blur(request.getfixturevalue(src), sigma=0.5)
+        assert_close(result, expected)
 
 
 class TestFilterGlow:
@@ -92,38 +110,24 @@ class TestFilterGlow:
         should zoom into the image by the size factor.
         """
         result = f.glow(video_2_5_5, sigma=4)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.7802, 0.8597, 0.9389, 0.9813, 1.0000],
-                [0.8597, 0.9211, 0.9736, 1.0000, 0.9813],
-                [0.9389, 0.9736, 1.0000, 0.9736, 0.9389],
-                [0.9813, 1.0000, 0.9736, 0.9211, 0.8597],
-                [1.0000, 0.9813, 0.9389, 0.8597, 0.7802],
-            ],
-            [
-                [1.0000, 0.9813, 0.9389, 0.8597, 0.7802],
-                [0.9813, 1.0000, 0.9736, 0.9211, 0.8597],
-                [0.9389, 0.9736, 1.0000, 0.9736, 0.9389],
-                [0.8597, 0.9211, 0.9736, 1.0000, 0.9813],
-                [0.7802, 0.8597, 0.9389, 0.9813, 1.0000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _GLOW)
 
 
 class TestFilterMotionBlur:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _MOTION_BLUR, id='image'),
+        pt.param('video_2_5_5', _MOTION_BLUR_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, an amount, and a direction,
         :func:`motion_blur` should perform a motion blur
-        on the image data.
+        on the image data. If given video data, the blur
+        should be performed on all frames.
         """
-        result = f.motion_blur(a, amount=2, axis=f.X_)
-        assert (np.around(result, 4) == np.array([
-            [0.1250, 0.1250, 0.3750, 0.6250, 0.8750],
-            [0.3750, 0.3750, 0.6250, 0.8750, 0.8750],
-            [0.6250, 0.6250, 0.8750, 0.8750, 0.6250],
-            [0.8750, 0.8750, 0.8750, 0.6250, 0.3750],
-            [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
-        ], dtype=float)).all()
+        result = f.motion_blur(
+            request.getfixturevalue(src), amount=2, axis=f.X_
+        )
+        assert_close(result, expected)
 
     def test_vertical(self, a):
         """Given image data, an amount, and a direction,
@@ -132,36 +136,7 @@ class TestFilterMotionBlur:
         the blur should be vertical.
         """
         result = f.motion_blur(a, amount=2, axis=f.Y_)
-        assert (np.around(result, 4) == np.array([
-            [0.1250, 0.3750, 0.6250, 0.8750, 0.8750],
-            [0.1250, 0.3750, 0.6250, 0.8750, 0.8750],
-            [0.3750, 0.6250, 0.8750, 0.8750, 0.6250],
-            [0.6250, 0.8750, 0.8750, 0.6250, 0.3750],
-            [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given image data, an amount, and a direction,
-        :func:`motion_blur` should perform a motion blur
-        on the video data.
-        """
-        result = f.motion_blur(video_2_5_5, amount=2, axis=f.X_)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.1250, 0.1250, 0.3750, 0.6250, 0.8750],
-                [0.3750, 0.3750, 0.6250, 0.8750, 0.8750],
-                [0.6250, 0.6250, 0.8750, 0.8750, 0.6250],
-                [0.8750, 0.8750, 0.8750, 0.6250, 0.3750],
-                [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
-            ],
-            [
-                [0.8750, 0.8750, 0.6250, 0.3750, 0.1250],
-                [0.8750, 0.8750, 0.8750, 0.6250, 0.3750],
-                [0.6250, 0.6250, 0.8750, 0.8750, 0.6250],
-                [0.3750, 0.3750, 0.6250, 0.8750, 0.8750],
-                [0.1250, 0.1250, 0.3750, 0.6250, 0.8750],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _MOTION_BLUR_VERTICAL)
 
     def test_invalid_axis(self, a):
         """If given an invalid axis, :func:`motion_blur` should
@@ -8,224 +8,199 @@ import numpy as np
 import pytest as pt
 
 from pjimg.filters import distort as f
+from tests.common import assert_close
 from tests.fixtures import a, video_2_5_5
 
 
+# Expected results.
+_LINEAR_TO_POLAR = np.array([
+    [0.0000, 0.2500, 0.0000, 0.0000, 0.0000],
+    [0.2500, 0.5000, 0.7500, 0.5000, 0.2500],
+    [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
+    [0.5000, 1.0000, 0.7500, 0.5000, 0.5000],
+    [0.5000, 0.7500, 1.0000, 0.7500, 1.0000],
+], dtype=float)
+_LINEAR_TO_POLAR_VIDEO = np.stack((
+    _LINEAR_TO_POLAR,
+    np.array([
+        [0.0000, 0.7500, 1.0000, 1.0000, 1.0000],
+        [0.7500, 1.0000, 0.7500, 0.5000, 0.7500],
+        [0.7500, 0.7500, 0.5000, 0.2500, 0.5000],
+        [0.5000, 1.0000, 0.7500, 1.0000, 0.5000],
+        [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
+    ], dtype=float),
+))
+_PINCH = np.array([
+    [0.0000, 0.0859, 0.1465, 0.2441, 0.3438],
+    [0.0859, 0.2188, 0.4609, 0.8340, 0.3896],
+    [0.1465, 0.4609, 0.6719, 0.7500, 0.0713],
+    [0.2441, 0.8340, 0.7500, 0.1719, 0.0225],
+    [0.3438, 0.3896, 0.0713, 0.0225, 0.0000],
+], dtype=float)
+_PINCH_VIDEO = np.stack((
+    _PINCH,
+    np.array([
+        [0.5166, 0.4141, 0.1660, 0.0684, 0.0000],
+        [0.4141, 0.8770, 0.6016, 0.2109, 0.0479],
+        [0.1660, 0.6016, 0.8872, 0.4219, 0.0537],
+        [0.0684, 0.2109, 0.4219, 0.8872, 0.1025],
+        [0.0000, 0.0479, 0.0537, 0.1025, 0.1914],
+    ], dtype=float),
+))
+_POLAR_TO_LINEAR = np.array([
+    [1.0000, 0.7500, 0.5000, 0.0000, 0.0000],
+    [1.0000, 0.5000, 0.2500, 0.0000, 0.0000],
+    [1.0000, 0.7500, 1.0000, 0.7500, 1.0000],
+    [1.0000, 1.0000, 0.7500, 0.5000, 0.2500],
+    [1.0000, 0.7500, 1.0000, 0.7500, 0.7500],
+], dtype=float)
+_POLAR_TO_LINEAR_VIDEO = np.stack((
+    _POLAR_TO_LINEAR,
+    np.array([
+        [1.0000, 0.7500, 0.5000, 0.0000, 0.0000],
+        [1.0000, 1.0000, 0.7500, 0.0000, 0.0000],
+        [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
+        [1.0000, 1.0000, 0.7500, 1.0000, 0.7500],
+        [1.0000, 0.7500, 0.5000, 0.2500, 0.2500],
+    ], dtype=float),
+))
+_RIPPLE = np.array([
+    [1.0000, 0.0000, 0.5000, 0.0000, 0.0000],
+    [0.0000, 0.0000, 0.7500, 0.0000, 0.7500],
+    [0.5000, 0.7500, 0.0000, 0.0000, 0.0000],
+    [0.0000, 0.0000, 0.0000, 0.5000, 0.0000],
+    [0.0000, 0.7500, 0.0000, 0.0000, 0.0000],
+], dtype=float)
+_RIPPLE_VIDEO = np.stack((
+    _RIPPLE,
+    np.array([
+        [1.0000, 0.0000, 0.5000, 0.0000, 0.0000],
+        [0.0000, 0.0000, 0.2500, 0.0000, 0.7500],
+        [0.5000, 0.2500, 1.0000, 0.0000, 0.0000],
+        [0.0000, 0.0000, 0.0000, 1.0000, 0.0000],
+        [0.0000, 0.7500, 0.0000, 0.0000, 0.0000],
+    ], dtype=float),
+))
+_TWIRL = np.array([
+    [0.0019, 0.2537, 0.5047, 0.7547, 0.9963],
+    [0.2491, 0.5001, 0.7565, 0.9871, 0.7499],
+    [0.4969, 0.7438, 0.9785, 0.7275, 0.4935],
+    [0.7468, 0.9873, 0.7715, 0.5010, 0.2438],
+    [0.9963, 0.7586, 0.5129, 0.2627, 0.0088],
+], dtype=float)
+_TWIRL_VIDEO = np.stack((
+    _TWIRL,
+    np.array([
+        [0.9981, 0.7491, 0.4968, 0.2469, 0.0037],
+        [0.7537, 0.9912, 0.7373, 0.4938, 0.2588],
+        [0.5047, 0.7626, 0.9775, 0.7510, 0.5127],
+        [0.2547, 0.5065, 0.7510, 0.9775, 0.7626],
+        [0.0037, 0.2501, 0.4938, 0.7435, 0.9914],
+    ], dtype=float),
+))
+_TWIRL_OFFSET_VIDEO = np.array([
+    [
+        [0.0005, 0.2515, 0.5047, 0.7626, 0.9785],
+        [0.2496, 0.4985, 0.7453, 0.9873, 0.7715],
+        [0.4998, 0.7487, 0.9963, 0.7586, 0.5129],
+        [0.7499, 0.9992, 0.7519, 0.5037, 0.2547],
+        [0.9999, 0.7503, 0.5008, 0.2513, 0.0015],
+    ],
+    [
+        [0.9995, 0.7511, 0.5031, 0.2562, 0.0225],
+        [0.7505, 0.9985, 0.7468, 0.4935, 0.2490],
+        [0.5004, 0.7505, 0.9963, 0.7499, 0.5062],
+        [0.2503, 0.5001, 0.7500, 0.9963, 0.7531],
+        [0.0001, 0.2500, 0.4999, 0.7495, 0.9985],
+    ],
+], dtype=float)
+
+
 # Test Cases.
 class TestLinearToPolar:
-    def test_filter(self, a):
-        """Given image data, :func:`linear_to_polar` convert the
-        linear coordinates to polar coordinates.
-        """
-        result = f.linear_to_polar(a)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.2500, 0.0000, 0.0000, 0.0000],
-            [0.2500, 0.5000, 0.7500, 0.5000, 0.2500],
-            [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
-            [0.5000, 1.0000, 0.7500, 0.5000, 0.5000],
-            [0.5000, 0.7500, 1.0000, 0.7500, 1.0000],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _LINEAR_TO_POLAR, id='image'),
+        pt.param('video_2_5_5', _LINEAR_TO_POLAR_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, :func:`linear_to_polar` convert the
         linear coordinates to polar coordinates. This should also work
         for video.
         """
-        result = f.linear_to_polar(video_2_5_5)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0000, 0.2500, 0.0000, 0.0000, 0.0000],
-                [0.2500, 0.5000, 0.7500, 0.5000, 0.2500],
-                [0.2500, 0.7500, 1.0000, 0.7500, 0.5000],
-                [0.5000, 1.0000, 0.7500, 0.5000, 0.5000],
-                [0.5000, 0.7500, 1.0000, 0.7500, 1.0000],
-            ],
-            [
-                [0.0000, 0.7500, 1.0000, 1.0000, 1.0000],
-                [0.7500, 1.0000, 0.7500, 0.5000, 0.7500],
-                [0.7500, 0.7500, 0.5000, 0.2500, 0.5000],
-                [0.5000, 1.0000, 0.7500, 1.0000, 0.5000],
-                [0.5000, 0.7500, 1.0000, 0.7500, 0.5000],
-            ],
-        ], dtype=float)).all()
+        result = f.linear_to_polar(request.getfixturevalue(src))
+        assert_close(result, expected)
 
 
 class TestPinch:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _PINCH, id='image'),
+        pt.param('video_2_5_5', _PINCH_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, an amount of the pinch, a radius, a
         scale, and an offset, :func:`pinch` should perform
-        a pinch on the image data.
+        a pinch on the image data. This should also work for video.
         """
         result = f.pinch(
-            a,
+            request.getfixturevalue(src),
             amount=0.5,
             radius=3.0,
             scale=(0.5, 0.5),
             offset=(0, 0, 0)
         )
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.0859, 0.1465, 0.2441, 0.3438],
-            [0.0859, 0.2188, 0.4609, 0.8340, 0.3896],
-            [0.1465, 0.4609, 0.6719, 0.7500, 0.0713],
-            [0.2441, 0.8340, 0.7500, 0.1719, 0.0225],
-            [0.3438, 0.3896, 0.0713, 0.0225, 0.0000],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given image data, :func:`linear_to_polar` convert the
-        linear coordinates to polar coordinates. This should also work
-        for video.
-        """
-        result = f.pinch(
-            video_2_5_5,
-            amount=0.5,
-            radius=3.0,
-            scale=(0.5, 0.5),
-            offset=(0, 0, 0)
-        )
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0000, 0.0859, 0.1465, 0.2441, 0.3438],
-                [0.0859, 0.2188, 0.4609, 0.8340, 0.3896],
-                [0.1465, 0.4609, 0.6719, 0.7500, 0.0713],
-                [0.2441, 0.8340, 0.7500, 0.1719, 0.0225],
-                [0.3438, 0.3896, 0.0713, 0.0225, 0.0000],
-            ],
-            [
-                [0.5166, 0.4141, 0.1660, 0.0684, 0.0000],
-                [0.4141, 0.8770, 0.6016, 0.2109, 0.0479],
-                [0.1660, 0.6016, 0.8872, 0.4219, 0.0537],
-                [0.0684, 0.2109, 0.4219, 0.8872, 0.1025],
-                [0.0000, 0.0479, 0.0537, 0.1025, 0.1914],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, expected)
 
 
 class TestPolarToLinear:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _POLAR_TO_LINEAR, id='image'),
+        pt.param('video_2_5_5', _POLAR_TO_LINEAR_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, :func:`polar_to_linear` should convert
-        the polar coordinates to linear coordinates.
+        the polar coordinates to linear coordinates. This should also
+        work for video.
         """
-        result = f.polar_to_linear(a)
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.7500, 0.5000, 0.0000, 0.0000],
-            [1.0000, 0.5000, 0.2500, 0.0000, 0.0000],
-            [1.0000, 0.7500, 1.0000, 0.7500, 1.0000],
-            [1.0000, 1.0000, 0.7500, 0.5000, 0.2500],
-            [1.0000, 0.7500, 1.0000, 0.7500, 0.7500],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given image data, :func:`linear_to_polar` convert the
-        linear coordinates to polar coordinates. This should also work
-        for video.
-        """
-        result = f.polar_to_linear(video_2_5_5)
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.7500, 0.5000, 0.0000, 0.0000],
-                [1.0000, 0.5000, 0.2500, 0.0000, 0.0000],
-                [1.0000, 0.7500, 1.0000, 0.7500, 1.0000],
-                [1.0000, 1.0000, 0.7500, 0.5000, 0.2500],
-                [1.0000, 0.7500, 1.0000, 0.7500, 0.7500],
-            ],
-            [
-                [1.0000, 0.7500, 0.5000, 0.0000, 0.0000],
-                [1.0000, 1.0000, 0.7500, 0.0000, 0.0000],
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-                [1.0000, 1.0000, 0.7500, 1.0000, 0.7500],
-                [1.0000, 0.7500, 0.5000, 0.2500, 0.2500],
-            ],
-        ], dtype=float)).all()
+        result = f.polar_to_linear(request.getfixturevalue(src))
+        assert_close(result, expected)
 
 
 class TestRipple:
-    def test_filter(self, a):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _RIPPLE, id='image'),
+        pt.param('video_2_5_5', _RIPPLE_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, :func:`ripple` should convert
-        the polar coordinates to linear coordinates.
-        """
-        result = f.ripple(
-            a,
-            wave=(2, 2),
-            amp=(2, 2),
-            distaxis=(f.Y_, f.X_),
-            offset=(0, 0)
-        )
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.0000, 0.5000, 0.0000, 0.0000],
-            [0.0000, 0.0000, 0.7500, 0.0000, 0.7500],
-            [0.5000, 0.7500, 0.0000, 0.0000, 0.0000],
-            [0.0000, 0.0000, 0.0000, 0.5000, 0.0000],
-            [0.0000, 0.7500, 0.0000, 0.0000, 0.0000],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
-        """Given image data, :func:`ripple` convert the
-        linear coordinates to polar coordinates. This should also work
-        for video.
+        the polar coordinates to linear coordinates. This should also
+        work for video.
         """
         result = f.ripple(
-            video_2_5_5,
+            request.getfixturevalue(src),
             wave=(2, 2),
             amp=(2, 2),
             distaxis=(f.Y_, f.X_),
             offset=(0, 0)
         )
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.0000, 0.5000, 0.0000, 0.0000],
-                [0.0000, 0.0000, 0.7500, 0.0000, 0.7500],
-                [0.5000, 0.7500, 0.0000, 0.0000, 0.0000],
-                [0.0000, 0.0000, 0.0000, 0.5000, 0.0000],
-                [0.0000, 0.7500, 0.0000, 0.0000, 0.0000],
-            ],
-            [
-                [1.0000, 0.0000, 0.5000, 0.0000, 0.0000],
-                [0.0000, 0.0000, 0.2500, 0.0000, 0.7500],
-                [0.5000, 0.2500, 1.0000, 0.0000, 0.0000],
-                [0.0000, 0.0000, 0.0000, 1.0000, 0.0000],
-                [0.0000, 0.7500, 0.0000, 0.0000, 0.0000],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, expected)
 
 
 class TestTwirl:
-    def test_filter(self, a):
-        """Given image data, a radius, a strength, and an offset,
-        :func:`skew` should perform a twirl distortion on
-        the data.
-        """
-        result = f.twirl(a, radius=5.0, strength=0.25)
-        assert (np.around(result, 4) == np.array([
-            [0.0019, 0.2537, 0.5047, 0.7547, 0.9963],
-            [0.2491, 0.5001, 0.7565, 0.9871, 0.7499],
-            [0.4969, 0.7438, 0.9785, 0.7275, 0.4935],
-            [0.7468, 0.9873, 0.7715, 0.5010, 0.2438],
-            [0.9963, 0.7586, 0.5129, 0.2627, 0.0088],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _TWIRL, id='image'),
+        pt.param('video_2_5_5', _TWIRL_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, a radius, a strength, and an offset,
         :func:`skew` should perform a twirl distortion on
         the data. This should also work for video.
         """
-        result = f.twirl(video_2_5_5, radius=5.0, strength=0.25)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0019, 0.2537, 0.5047, 0.7547, 0.9963],
-                [0.2491, 0.5001, 0.7565, 0.9871, 0.7499],
-                [0.4969, 0.7438, 0.9785, 0.7275, 0.4935],
-                [0.7468, 0.9873, 0.7715, 0.5010, 0.2438],
-                [0.9963, 0.7586, 0.5129, 0.2627, 0.0088],
-            ],
-            [
-                [0.9981, 0.7491, 0.4968, 0.2469, 0.0037],
-                [0.7537, 0.9912, 0.7373, 0.4938, 0.2588],
-                [0.5047, 0.7626, 0.9775, 0.7510, 0.5127],
-                [0.2547, 0.5065, 0.7510, 0.9775, 0.7626],
-                [0.0037, 0.2501, 0.4938, 0.7435, 0.9914],
-            ],
-        ], dtype=float)).all()
+        result = f.twirl(
+            request.getfixturevalue(src),
+            radius=5.0,
+            strength=0.25
+        )
+        assert_close(result, expected)
 
     def test_video_offset(self, video_2_5_5):
         """Given image data, a radius, a strength, and an offset,
@@ -236,19 +211,4 @@ class TestTwirl:
         result = f.twirl(
             video_2_5_5, radius=5.0, strength=0.25, offset=(-2, 2)
         )
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0005, 0.2515, 0.5047, 0.7626, 0.9785],
-                [0.2496, 0.4985, 0.7453, 0.9873, 0.7715],
-                [0.4998, 0.7487, 0.9963, 0.7586, 0.5129],
-                [0.7499, 0.9992, 0.7519, 0.5037, 0.2547],
-                [0.9999, 0.7503, 0.5008, 0.2513, 0.0015],
-            ],
-            [
-                [0.9995, 0.7511, 0.5031, 0.2562, 0.0225],
-                [0.7505, 0.9985, 0.7468, 0.4935, 0.2490],
-                [0.5004, 0.7505, 0.9963, 0.7499, 0.5062],
-                [0.2503, 0.5001, 0.7500, 0.9963, 0.7531],
-                [0.0001, 0.2500, 0.4999, 0.7495, 0.9985],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _TWIRL_OFFSET_VIDEO)
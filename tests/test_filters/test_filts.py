@@ -8,9 +8,91 @@ import numpy as np
 import pytest as pt
 
 from pjimg.filters import value as f
+from tests.common import assert_close
 from tests.fixtures import *
 
 
+# Expected results.
+_COLORIZE = np.array([
+    [
+        [1.0000, 0.0000, 0.1686],
+        [0.4980, 0.0000, 0.0824],
+        [0.0000, 0.0000, 0.0000],
+    ],
+    [
+        [0.4980, 0.0000, 0.0824],
+        [0.0000, 0.0000, 0.0000],
+        [0.4980, 0.0000, 0.0824],
+    ],
+    [
+        [0.0000, 0.0000, 0.0000],
+        [0.4980, 0.0000, 0.0824],
+        [1.0000, 0.0000, 0.1686],
+    ],
+], dtype=float)
+# Both frames of the video are the same image.
+_COLORIZE_VIDEO = np.stack((_COLORIZE,) * 2)
+_CONTRAST = np.array([
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+], dtype=float)
+_CONTRAST_BLACK = np.array([
+    [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
+    [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
+    [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
+    [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
+    [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
+], dtype=float)
+_CONTRAST_WHITE = np.array([
+    [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
+    [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
+    [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
+    [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
+    [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
+], dtype=float)
+_CUT_HIGHLIGHT = np.array([
+    [0.00, 0.50, 1.00, 1.00, 1.00,],
+    [0.50, 1.00, 1.00, 1.00, 1.00,],
+    [1.00, 1.00, 1.00, 1.00, 1.00,],
+    [1.00, 1.00, 1.00, 1.00, 0.50,],
+    [1.00, 1.00, 1.00, 0.50, 0.00,],
+], dtype=float)
+_CUT_SHADOW = np.array([
+    [0.00, 0.00, 0.00, 0.50, 1.00,],
+    [0.00, 0.00, 0.50, 1.00, 0.50,],
+    [0.00, 0.50, 1.00, 0.50, 0.00,],
+    [0.50, 1.00, 0.50, 0.00, 0.00,],
+    [1.00, 0.50, 0.00, 0.00, 0.00,],
+], dtype=float)
+_DISTANCE = np.array([
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+    [0.2500, 0.3500, 0.5492, 0.7992, 0.7500],
+    [0.5000, 0.5492, 0.7000, 0.5492, 0.5000],
+    [0.7500, 0.7992, 0.5492, 0.3500, 0.2500],
+    [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
+], dtype=float)
+_INVERSE = np.array([
+    [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
+    [0.7500, 0.5000, 0.2500, 0.0000, 0.2500],
+    [0.5000, 0.2500, 0.0000, 0.2500, 0.5000],
+    [0.2500, 0.0000, 0.2500, 0.5000, 0.7500],
+    [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
+], dtype=float)
+_POSTERIZE = np.array([
+    [0.0000, 0.0000, 0.5000, 1.0000, 1.0000],
+    [0.0000, 0.5000, 1.0000, 1.0000, 1.0000],
+    [0.5000, 1.0000, 1.0000, 1.0000, 0.5000],
+    [1.0000, 1.0000, 1.0000, 0.5000, 0.0000],
+    [1.0000, 1.0000, 0.5000, 0.0000, 0.0000],
+], dtype=float)
+# Posterizing works on each pixel alone, and the second frame of the
+# video is the first frame flipped vertically.
+_POSTERIZE_VIDEO = np.stack((_POSTERIZE, _POSTERIZE[::-1]))
+
+
 # Test cases.
 class TestFilterColorize:
     def test_filter(self, image_1_3_3):
@@ -23,96 +105,22 @@ class TestFilterColorize:
             white='hsv(350, 100%, 100%)',
             black='hsv(10, 100%, 0%)'
         )
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.0000, 0.1686],
-                [0.4980, 0.0000, 0.0824],
-                [0.0000, 0.0000, 0.0000],
-            ],
-            [
-                [0.4980, 0.0000, 0.0824],
-                [0.0000, 0.0000, 0.0000],
-                [0.4980, 0.0000, 0.0824],
-            ],
-            [
-                [0.0000, 0.0000, 0.0000],
-                [0.4980, 0.0000, 0.0824],
-                [1.0000, 0.0000, 0.1686],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, _COLORIZE)
 
-    def test_by_colorkey(self, image_1_3_3):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('image_1_3_3', _COLORIZE, id='image'),
+        pt.param('video_2_3_3', _COLORIZE_VIDEO, id='video'),
+    ))
+    def test_by_colorkey(self, src, expected, request):
         """Given an color key and grayscale image data,
         :func:`colorize` should apply the color to
-        the image data.
+        the image data. This should also work for video.
         """
         result = f.colorize(
-            image_1_3_3,
+            request.getfixturevalue(src),
             colorkey='s'
         )
-        assert (np.around(result, 4) == np.array([
-            [
-                [1.0000, 0.0000, 0.1686],
-                [0.4980, 0.0000, 0.0824],
-                [0.0000, 0.0000, 0.0000],
-            ],
-            [
-                [0.4980, 0.0000, 0.0824],
-                [0.0000, 0.0000, 0.0000],
-                [0.4980, 0.0000, 0.0824],
-            ],
-            [
-                [0.0000, 0.0000, 0.0000],
-                [0.4980, 0.0000, 0.0824],
-                [1.0000, 0.0000, 0.1686],
-            ],
-        ], dtype=float)).all()
-
-    def test_on_video(self, video_2_3_3):
-        """Given an RGB color and grayscale image data,
-        :func:`colorize` should apply the color to
-        the video data.
-        """
-        result = f.colorize(
-            video_2_3_3,
-            colorkey='s'
-        )
-        assert (np.around(result, 4) == np.array([
-            [
-                [
-                    [1.0000, 0.0000, 0.1686],
-                    [0.4980, 0.0000, 0.0824],
-                    [0.0000, 0.0000, 0.0000],
-                ],
-                [
-                    [0.4980, 0.0000, 0.0824],
-                    [0.0000, 0.0000, 0.0000],
-                    [0.4980, 0.0000, 0.0824],
-                ],
-                [
-                    [0.0000, 0.0000, 0.0000],
-                    [0.4980, 0.0000, 0.0824],
-                    [1.0000, 0.0000, 0.1686],
-                ],
-            ],
-            [
-                [
-                    [1.0000, 0.0000, 0.1686],
-                    [0.4980, 0.0000, 0.0824],
-                    [0.0000, 0.0000, 0.0000],
-                ],
-                [
-                    [0.4980, 0.0000, 0.0824],
-                    [0.0000, 0.0000, 0.0000],
-                    [0.4980, 0.0000, 0.0824],
-                ],
-                [
-                    [0.0000, 0.0000, 0.0000],
-                    [0.4980, 0.0000, 0.0824],
-                    [1.0000, 0.0000, 0.1686],
-                ],
-            ],
-        ], dtype=float)).all()
+        assert_close(result, expected)
 
 
 class TestFilterContrast:
@@ -122,13 +130,7 @@ class TestFilterContrast:
         and the lightest is white.
         """
         result = f.contrast(image_5_5_low_contrast)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-        ], dtype=float)).all()
+        assert_close(result, _CONTRAST)
 
     def test_black(self, image_5_5_low_contrast):
         """Given image data and a black point, :func:`contrast`
@@ -136,13 +138,7 @@ class TestFilterContrast:
         given black point and the lightest is white.
         """
         result = f.contrast(image_5_5_low_contrast, black=0.5)
-        assert (np.around(result, 4) == np.array([
-            [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
-            [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
-            [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
-            [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
-            [0.5000, 0.6250, 0.7500, 0.8750, 1.0000],
-        ], dtype=float)).all()
+        assert_close(result, _CONTRAST_BLACK)
 
     def test_white(self, image_5_5_low_contrast):
         """Given image data and a white point, :func:`contrast`
@@ -150,13 +146,7 @@ class TestFilterContrast:
         and the lightest is the given maximum.
         """
         result = f.contrast(image_5_5_low_contrast, white=0.5)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
-            [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
-            [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
-            [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
-            [0.0000, 0.1250, 0.2500, 0.3750, 0.5000],
-        ], dtype=float)).all()
+        assert_close(result, _CONTRAST_WHITE)
 
 
 class TestFilterCutHighlight:
@@ -167,13 +157,7 @@ class TestFilterCutHighlight:
         """
         threshold = 0.5
         result = f.cut_highlight(a, threshold=threshold)
-        assert (np.around(result, 4) == np.array([
-            [0.00, 0.50, 1.00, 1.00, 1.00,],
-            [0.50, 1.00, 1.00, 1.00, 1.00,],
-            [1.00, 1.00, 1.00, 1.00, 1.00,],
-            [1.00, 1.00, 1.00, 1.00, 0.50,],
-            [1.00, 1.00, 1.00, 0.50, 0.00,],
-        ], dtype=float)).all()
+        assert_close(result, _CUT_HIGHLIGHT)
 
 
 class TestFilterCutShadow:
@@ -184,13 +168,7 @@ class TestFilterCutShadow:
         """
         threshold = 0.5
         result = f.cut_shadow(a, threshold=threshold)
-        assert (np.around(result, 4) == np.array([
-            [0.00, 0.00, 0.00, 0.50, 1.00,],
-            [0.00, 0.00, 0.50, 1.00, 0.50,],
-            [0.00, 0.50, 1.00, 0.50, 0.00,],
-            [0.50, 1.00, 0.50, 0.00, 0.00,],
-            [1.00, 0.50, 0.00, 0.00, 0.00,],
-        ], dtype=float)).all()
+        assert_close(result, _CUT_SHADOW)
 
 
 class TestDistance:
@@ -200,13 +178,7 @@ class TestDistance:
         relative distance to the nearest black value.
         """
         result = f.distance(a)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-            [0.2500, 0.3500, 0.5492, 0.7992, 0.7500],
-            [0.5000, 0.5492, 0.7000, 0.5492, 0.5000],
-            [0.7500, 0.7992, 0.5492, 0.3500, 0.2500],
-            [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-        ], dtype=float)).all()
+        assert_close(result, _DISTANCE)
 
 
 class TestFilterInverse:
@@ -215,48 +187,18 @@ class TestFilterInverse:
         colors of the image data.
         """
         result = f.inverse(a)
-        assert (np.around(result, 4) == np.array([
-            [1.0000, 0.7500, 0.5000, 0.2500, 0.0000],
-            [0.7500, 0.5000, 0.2500, 0.0000, 0.2500],
-            [0.5000, 0.2500, 0.0000, 0.2500, 0.5000],
-            [0.2500, 0.0000, 0.2500, 0.5000, 0.7500],
-            [0.0000, 0.2500, 0.5000, 0.7500, 1.0000],
-        ], dtype=float)).all()
+        assert_close(result, _INVERSE)
 
 
 class TestFilterPosterize:
-    def test_filter(self, a):
-        """Given image data, :func:`posterize` should reduce the
-        number of colors in the image data.
-        """
-        result = f.posterize(a, levels=3)
-        assert (np.around(result, 4) == np.array([
-            [0.0000, 0.0000, 0.5000, 1.0000, 1.0000],
-            [0.0000, 0.5000, 1.0000, 1.0000, 1.0000],
-            [0.5000, 1.0000, 1.0000, 1.0000, 0.5000],
-            [1.0000, 1.0000, 1.0000, 0.5000, 0.0000],
-            [1.0000, 1.0000, 0.5000, 0.0000, 0.0000],
-        ], dtype=float)).all()
-
-    def test_video(self, video_2_5_5):
+    @pt.mark.parametrize('src,expected', (
+        pt.param('a', _POSTERIZE, id='image'),
+        pt.param('video_2_5_5', _POSTERIZE_VIDEO, id='video'),
+    ))
+    def test_filter(self, src, expected, request):
         """Given image data, :func:`posterize` should reduce the
         number of colors in the image data. This should also work
         for video.
         """
-        result = f.posterize(video_2_5_5, levels=3)
-        assert (np.around(result, 4) == np.array([
-            [
-                [0.0000, 0.0000, 0.5000, 1.0000, 1.0000],
-                [0.0000, 0.5000, 1.0000, 1.0000, 1.0000],
-                [0.5000, 1.0000, 1.0000, 1.0000, 0.5000],
-                [1.0000, 1.0000, 1.0000, 0.5000, 0.0000],
-                [1.0000, 1.0000, 0.5000, 0.0000, 0.0000],
-            ],
-            [
-                [1.0000, 1.0000, 0.5000, 0.0000, 0.0000],
-                [1.0000, 1.0000, 1.0000, 0.5000, 0.0000],
-                [0.5000, 1.0000, 1.0000, 1.0000, 0.5000],
-                [0.0000, 0.5000, 1.0000, 1.0000, 1.0000],
-                [0.0000, 0.0000, 0.5000, 1.0000, 1.0000],
-            ],
-        ], dtype=float)).all()
+        result = f.posterize(request.getfixturevalue(src), levels=3)
+        assert_close(result, expected)
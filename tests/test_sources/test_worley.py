@@ -26,6 +26,7 @@ class TestWorley:
             'volume': None,
             'origin': (0, 0, 0),
             'seed': None,
+            'squared': False,
         }
         obj = w.Worley(**required)
         for attr in required:
@@ -44,6 +45,7 @@ class TestWorley:
             'volume': (1, 3, 4),
             'origin': (4, 4, 4),
             'seed': 'spam',
+            'squared': True,
         }
         obj = w.Worley(**required, **optional)
         for attr in required:
@@ -104,6 +106,26 @@ class TestWorley:
             ],
         ], dtype=np.uint8)).all()
 
+    def test_fill_squared(self):
+        """If squared is set, :meth:`Worley.fill` should return the
+        square of the normalized distances it would otherwise return.
+        """
+        kwargs = {'points': 6, 'volume': None, 'seed': 'spam',}
+        size = (3, 12, 8)
+        exp = w.Worley(**kwargs).fill(size) ** 2
+        obj = w.Worley(**kwargs, squared=True)
+        assert np.allclose(obj.fill(size), exp)
+
+    def test_fill_seeds_outside_fill(self):
+        """If the seeds are farther from every pixel than the length
+        of the diagonal of the filled volume, :meth:`Worley.fill`
+        should cap the distances at that length, so the volume
+        is filled with ones.
+        """
+        obj = w.Worley(points=3, origin=(0, 200, 200), seed='spam')
+        result = obj.fill((1, 6, 6))
+        assert (result == np.ones((1, 6, 6), dtype=float)).all()
+
 
 class TestOctaveWorley:
     # Tests for Worley initialization.
@@ -123,6 +145,7 @@ class TestOctaveWorley:
             'volume': None,
             'origin': (0, 0, 0),
             'seed': None,
+            'squared': False,
         }
         obj = w.OctaveWorley(**required)
         for attr in required:
@@ -144,6 +167,7 @@ class TestOctaveWorley:
             'volume': (1, 3, 4),
             'origin': (4, 4, 4),
             'seed': 'spam',
+            'squared': True,
         }
         obj = w.OctaveWorley(**required, **optional)
         for attr in required:
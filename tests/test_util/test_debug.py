@@ -23,12 +23,8 @@ class TestPrintArray:
         dbug.print_array(a)
         captured = capsys.readouterr()
         assert captured.out == '\n'.join([
-            '[',
-            '    [',
-            '        [0.0000, 0.5000, 1.0000],',
-            '        [0.0000, 0.5000, 1.0000],',
-            '    ],',
-            '],',
+            '[[[0.0000, 0.5000, 1.0000],',
+            '  [0.0000, 0.5000, 1.0000]]],',
             '',
         ])
 
@@ -45,11 +41,7 @@ class TestPrintArray:
         dbug.print_array(a)
         captured = capsys.readouterr()
         assert captured.out == '\n'.join([
-            '[',
-            '    [',
-            '        [0x00, 0x7f, 0xff],',
-            '        [0x00, 0x7f, 0xff],',
-            '    ],',
-            '],',
+            '[[[0x00, 0x7f, 0xff],',
+            '  [0x00, 0x7f, 0xff]]],',
             '',
         ])
@@ -21,3 +21,18 @@ def test_preserves_type():
     
     a = np.array([0.0, 0.5, 1.0,], dtype=float)
     assert change_type(a).dtype is np.dtype('float')
+
+
+def test_preserves_type_with_given_array():
+    """Given a function that stores its result in an array that was
+    passed to it, :func:`preserve_type` should return that array
+    without changing its data type.
+    """
+    @d.preserves_type
+    def store(a, out):
+        np.copyto(out, a, casting='unsafe')
+        return out
+
+    a = np.array([0.0, 0.5, 1.0,], dtype=float)
+    out = np.empty(3, dtype=int)
+    assert store(a, out=out) is out
@@ -43,6 +43,60 @@ def test_cubic_interpolation_without_primes():
     ).all()
 
 
+def test_cubic_interpolation_with_out():
+    """Given an array to store the result in as `out`,
+    :funct:`cubic_interpolation` should store the interpolated
+    values in that array and return it.
+    """
+    a = np.array([0.0, 1.0, 4.0, 9.0])
+    b = np.array([1.0, 4.0, 9.0, 16.0])
+    x = np.array([0.5, 0.5, 0.5, 0.5])
+    out = np.empty_like(a)
+    result = lp.cubic_interpolation(a, b, x, out=out)
+    assert result is out
+    assert (out == np.array(
+        [0.3125, 2.2500, 6.2500, 12.8125])
+    ).all()
+
+
+def test_cubic_interpolation_with_scalar_distance():
+    """Given a scalar as the distance, :funct:`cubic_interpolation`
+    should use that distance for every interpolated value.
+    """
+    a = np.array([0.0, 1.0, 4.0, 9.0])
+    b = np.array([1.0, 4.0, 9.0, 16.0])
+    assert (lp.cubic_interpolation(a, b, 0.5) == np.array(
+        [0.3125, 2.2500, 6.2500, 12.8125])
+    ).all()
+
+
+def test_cubic_interpolation_uint8_decreasing():
+    """Given unsigned integer arrays where the "right" values are
+    less than the "left" values, :funct:`cubic_interpolation`
+    should not wrap around when subtracting the values.
+    """
+    a = np.array([200, 10], dtype=np.uint8)
+    b = np.array([10, 200], dtype=np.uint8)
+    x = np.array([0.5, 0.5], dtype=float)
+    result = lp.cubic_interpolation(a, b, x)
+    assert result.dtype == np.uint8
+    assert (result == np.array([93, 93], dtype=np.uint8)).all()
+
+
+def test_cubic_interpolation_with_integer_out():
+    """Given an integer array to store the result in as `out`,
+    :funct:`cubic_interpolation` should interpolate in floats,
+    store the interpolated values in that array, and return it.
+    """
+    a = np.array([200, 10], dtype=np.uint8)
+    b = np.array([10, 200], dtype=np.uint8)
+    x = np.array([0.5, 0.5], dtype=float)
+    out = np.empty_like(a)
+    result = lp.cubic_interpolation(a, b, x, out=out)
+    assert result is out
+    assert (out == np.array([93, 93], dtype=np.uint8)).all()
+
+
 # Tests for linear_interpolation.
 def test_linear_interpolation():
     """Given two linear arrays of values and one linear array of
@@ -57,6 +111,35 @@ def test_linear_interpolation():
     )).all()
 
 
+def test_linear_interpolation_with_out():
+    """Given the "right" values as `out`,
+    :funct:`linear_interpolation` should store the interpolated
+    values in that array and return it.
+    """
+    a = np.array([0.0, 1.0, 2.0, 3.0, 4.0,])
+    b = np.array([1.0, 2.0, 3.0, 4.0, 5.0,])
+    x = np.array([0.5, 0.5, 0.5, 0.5, 0.5,])
+    result = lp.linear_interpolation(a, b, x, out=b)
+    assert result is b
+    assert (b == np.array(
+        [0.5, 1.5, 2.5, 3.5, 4.5,]
+    )).all()
+
+
+def test_linear_interpolation_with_integer_out():
+    """Given an integer array to store the result in as `out`,
+    :funct:`linear_interpolation` should interpolate in floats,
+    store the interpolated values in that array, and return it.
+    """
+    a = np.array([200, 10], dtype=np.uint8)
+    b = np.array([10, 200], dtype=np.uint8)
+    x = np.array([0.5, 0.5], dtype=float)
+    out = np.empty_like(a)
+    result = lp.linear_interpolation(a, b, x, out=out)
+    assert result is out
+    assert (out == np.array([105, 105], dtype=np.uint8)).all()
+
+
 def test_perserving_array_data_type():
     """The returned array from :funct:`linear_interpolation` should
     have the same datatype as the first of the given value arrays.
@@ -68,6 +151,19 @@ def test_perserving_array_data_type():
     assert result.dtype == np.uint8
 
 
+def test_linear_interpolation_uint8_decreasing():
+    """Given unsigned integer arrays where the "right" values are
+    less than the "left" values, :funct:`linear_interpolation`
+    should not wrap around when subtracting the values.
+    """
+    a = np.array([200, 10], dtype=np.uint8)
+    b = np.array([10, 200], dtype=np.uint8)
+    x = np.array([0.5, 0.5], dtype=float)
+    result = lp.linear_interpolation(a, b, x)
+    assert result.dtype == np.uint8
+    assert (result == np.array([105, 105], dtype=np.uint8)).all()
+
+
 # Tests for n_dimensional_interpolation
 def test_nderp_wrong_number_of_points():
     """If the passed values do not contain enough points
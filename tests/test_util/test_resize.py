@@ -4,6 +4,8 @@ test_resize
 
 Unit tests for the lerpy.resize module.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest as pt
 
@@ -41,6 +43,98 @@ class TestCropArray:
         ])).all()
 
 
+# Tests for bilinear_interpolation.
+def test_bilinear_interpolation_shrink():
+    """Given a two-dimensional array and a factor less than one,
+    :func:`bilinear_interpolation` should return a smaller array
+    with the values between the original points interpolated.
+    """
+    a = np.array([
+        [0.0, 1.0, 2.0, 3.0,],
+        [0.0, 1.0, 2.0, 3.0,],
+        [0.0, 1.0, 2.0, 3.0,],
+        [0.0, 1.0, 2.0, 3.0,],
+    ])
+    assert (rs.bilinear_interpolation(a, 0.75) == np.array([
+        [0.0, 1.5, 3.0,],
+        [0.0, 1.5, 3.0,],
+        [0.0, 1.5, 3.0,],
+    ])).all()
+
+
+def test_bilinear_interpolation_uint8():
+    """Given a two-dimensional array of integers and a factor,
+    :func:`bilinear_interpolation` should return an array of
+    integers with the interpolated values.
+    """
+    a = np.array([
+        [0, 2,],
+        [2, 4,],
+    ], dtype=np.uint8)
+    result = rs.bilinear_interpolation(a, 2)
+    assert result.dtype == np.uint8
+    assert (result == np.array([
+        [0, 1, 2, 2,],
+        [1, 2, 3, 3,],
+        [2, 3, 4, 4,],
+        [2, 3, 4, 4,],
+    ], dtype=np.uint8)).all()
+
+
+def test_bilinear_interpolation_uint8_decreasing():
+    """Given a two-dimensional array of integers that decrease
+    along an axis, :func:`bilinear_interpolation` should not wrap
+    around when interpolating between the values.
+    """
+    a = np.array([
+        [200, 10,],
+        [10, 200,],
+    ], dtype=np.uint8)
+    result = rs.bilinear_interpolation(a, 2)
+    assert result.dtype == np.uint8
+    assert (result == np.array([
+        [200, 105, 10, 10,],
+        [105, 105, 105, 105,],
+        [10, 105, 200, 200,],
+        [10, 105, 200, 200,],
+    ], dtype=np.uint8)).all()
+
+
+# Tests for trilinear_interpolation.
+def test_trilinear_interpolation_does_not_change_original():
+    """Given a three-dimensional array and a factor,
+    :func:`trilinear_interpolation` should not change the
+    original array.
+    """
+    a = np.array([
+        [
+            [0.0, 1.0,],
+            [1.0, 0.0,],
+        ],
+        [
+            [1.0, 0.0,],
+            [0.0, 1.0,],
+        ],
+    ])
+    original = a.copy()
+    rs.trilinear_interpolation(a, 2)
+    assert (a == original).all()
+
+
+def test_trilinear_interpolation_threaded(monkeypatch):
+    """When the Z planes are resized in threads,
+    :func:`trilinear_interpolation` should return the same
+    result as when they are resized in the calling thread.
+    """
+    a = np.arange(27, dtype=float).reshape((3, 3, 3))
+    exp = rs.trilinear_interpolation(a, 2)
+    with ThreadPoolExecutor(2) as threads:
+        monkeypatch.setattr(rs, '_threads', threads)
+        monkeypatch.setattr(rs, '_threaded_plane_size', 1)
+        act = rs.trilinear_interpolation(a, 2)
+    assert (act == exp).all()
+
+
 # Tests for build_resizing_matrices.
 def test_build_resizing_matrix_increase_size():
     """Given an original size and a final size,
@@ -138,6 +232,45 @@ def test_build_resizing_matrix_increase_size():
     ])).all()
 
 
+def test_build_resizing_matrix_cached():
+    """Given the same original size and final size,
+    :funct:`build_resizing_matrices` should return the same
+    read-only arrays rather than building new ones.
+    """
+    src_shape = (3, 3)
+    dst_shape = [5, 5]
+    first = rs.build_resizing_matrices(src_shape, dst_shape)
+    second = rs.build_resizing_matrices(list(src_shape), tuple(dst_shape))
+    for f, s in zip(first, second):
+        assert f is s
+        assert not f.flags.writeable
+
+
+def test_build_resizing_matrix_large_not_cached(monkeypatch):
+    """Given a final size too large to cache,
+    :funct:`build_resizing_matrices` should build new arrays
+    each time rather than keeping them in memory.
+    """
+    monkeypatch.setattr(rs, '_cached_matrix_size', 49)
+    src_shape = (3, 3)
+    dst_shape = (5, 5)
+    first = rs.build_resizing_matrices(src_shape, dst_shape)
+    second = rs.build_resizing_matrices(src_shape, dst_shape)
+    for f, s in zip(first, second):
+        assert f is not s
+        assert (f == s).all()
+
+
+def test_build_resizing_matrix_int32_indices():
+    """Given an original size and a final size,
+    :funct:`build_resizing_matrices` should return index arrays
+    with 32-bit integers.
+    """
+    a, b, _ = rs.build_resizing_matrices((3, 4), (5, 7))
+    assert a.dtype == np.int32
+    assert b.dtype == np.int32
+
+
 # Tests for magnify_size.
 def test_magnify_size():
     """Given the shape of an array and a magnification factor,
@@ -147,6 +280,14 @@ def test_magnify_size():
     assert rs.magnify_size((5, 5, 5), 2.0) == (10, 10, 10)
 
 
+def test_magnify_size_two_dimensions():
+    """Given the shape of a two-dimensional array and a magnification
+    factor, :funct:`magnify_size` should return the magnified shape
+    of the array.
+    """
+    assert rs.magnify_size((5, 3), 1.5) == (7, 4)
+
+
 # Tests for resize_array.
 def test_resize_array_three_dimensions():
     """Given a three-dimensional array and a new size,
@@ -297,3 +438,128 @@ def test_resize_array_ndcerp():
         [22.1523, 26.4688, 32.2852, 38.3125, 44.7812],
         [36.0000, 41.5625, 49.0000, 56.5000, 64.0000],
     ])).all()
+
+
+def test_resize_array_float32():
+    """Given a datatype, :funct:`resize_array` should perform the
+    interpolation in that datatype but return an array with the
+    datatype of the original array.
+    """
+    a = np.array([
+        [0.0, 1.0, 2.0, ],
+        [1.0, 2.0, 3.0, ],
+        [2.0, 3.0, 4.0, ],
+    ])
+    size = (5, 5)
+    act = rs.resize_array(a, size, dtype=np.float32)
+    assert act.dtype == a.dtype
+    assert (act == np.array([
+        [0.0, 0.5, 1.0, 1.5, 2.0, ],
+        [0.5, 1.0, 1.5, 2.0, 2.5, ],
+        [1.0, 1.5, 2.0, 2.5, 3.0, ],
+        [1.5, 2.0, 2.5, 3.0, 3.5, ],
+        [2.0, 2.5, 3.0, 3.5, 4.0, ],
+    ])).all()
+
+
+def test_resize_array_uint8_decreasing():
+    """Given an array of unsigned integers that decrease along an
+    axis, :funct:`resize_array` should not wrap around when
+    interpolating between the values.
+    """
+    a = np.array([
+        [200, 10, ],
+        [10, 200, ],
+    ], dtype=np.uint8)
+    act = rs.resize_array(a, (3, 3))
+    assert act.dtype == np.uint8
+    assert (act == np.array([
+        [200, 105, 10, ],
+        [105, 105, 105, ],
+        [10, 105, 200, ],
+    ], dtype=np.uint8)).all()
+
+
+def test_resize_array_linear_matches_gathered_points():
+    """Given an array and a new shape, :func:`resize_array` should
+    return the same result with the default linear interpolation as
+    it does when interpolating all the points around each new point.
+    """
+    a = np.arange(2 * 3 * 4, dtype=float).reshape((2, 3, 4)) ** 2
+    shape = (3, 5, 7)
+
+    def interpolator(a, b, x):
+        return lp.ndlerp(a, b, x)
+
+    assert (rs.resize_array(a, shape) == rs.resize_array(
+        a, shape, interpolator
+    )).all()
+
+
+def test_resize_array_one_axis():
+    """Given a new shape that only changes one axis,
+    :func:`resize_array` should only interpolate along that axis
+    and return a new array.
+    """
+    a = np.array([
+        [0.0, 1.0, 2.0, ],
+        [1.0, 2.0, 3.0, ],
+    ])
+    act = rs.resize_array(a, (2, 5))
+    assert not np.shares_memory(act, a)
+    assert (act == np.array([
+        [0.0, 0.5, 1.0, 1.5, 2.0, ],
+        [1.0, 1.5, 2.0, 2.5, 3.0, ],
+    ])).all()
+
+
+def test_resize_array_out():
+    """Given an array to store the result in as `out`,
+    :func:`resize_array` should store the resized array in it
+    and return it.
+    """
+    a = np.array([
+        [0.0, 1.0, 2.0, ],
+        [1.0, 2.0, 3.0, ],
+        [2.0, 3.0, 4.0, ],
+    ])
+    out = np.empty((5, 5), dtype=float)
+    act = rs.resize_array(a, (5, 5), out=out)
+    assert act is out
+    assert (out == np.array([
+        [0.0, 0.5, 1.0, 1.5, 2.0, ],
+        [0.5, 1.0, 1.5, 2.0, 2.5, ],
+        [1.0, 1.5, 2.0, 2.5, 3.0, ],
+        [1.5, 2.0, 2.5, 3.0, 3.5, ],
+        [2.0, 2.5, 3.0, 3.5, 4.0, ],
+    ])).all()
+
+
+def test_resize_array_out_same_shape():
+    """Given an array to store the result in as `out` and the
+    shape of the original array, :func:`resize_array` should
+    copy the original array into it and return it.
+    """
+    a = np.array([
+        [0.0, 1.0, 2.0, ],
+        [1.0, 2.0, 3.0, ],
+        [2.0, 3.0, 4.0, ],
+    ])
+    out = np.empty((3, 3), dtype=float)
+    act = rs.resize_array(a, (3, 3), out=out)
+    assert act is out
+    assert (out == a).all()
+
+
+def test_resize_array_out_ndcerp():
+    """Given an array to store the result in as `out` and an
+    interpolator other than :func:`ndlerp`, :func:`resize_array`
+    should store the resized array in it and return it.
+    """
+    a = np.arange(9, dtype=float).reshape((3, 3))
+    a = a ** 2
+    exp = rs.resize_array(a, (5, 5), lp.ndcerp)
+    out = np.empty((5, 5), dtype=float)
+    act = rs.resize_array(a, (5, 5), lp.ndcerp, out=out)
+    assert act is out
+    assert (out == exp).all()
@@ -4,11 +4,29 @@ test_util
 
 Unit tests for :mod:`pjimg.util.util`.
 """
+import numpy as np
+
 import tests.spam as spam
 from pjimg.util import util as u
 
 
 # Test cases.
+def test_find_center():
+    """Given the size of an image and an offset, :func:`find_center`
+    should return the location of the center pixel shifted by the
+    offset.
+    """
+    assert u.find_center((3, 720, 1280), (0, 10, -10)) == (1, 370, 630)
+
+
+def test_find_center_two_dimensions():
+    """Given the size of a two-dimensional image and an offset,
+    :func:`find_center` should return the location of the center
+    pixel shifted by the offset.
+    """
+    assert u.find_center((720, 1280), (10, -10)) == (370, 630)
+
+
 def test_get_free_rotation_size_2d():
     """Given the final size of an image, :func:`get_free_rotation_size_2d`
     should return the size of image data needed to allow that image to
@@ -42,3 +60,39 @@ def test_get_prefixed_functions():
         'bacon': spam.spam_bacon,
         'baked_beans': spam.spam_baked_beans,
     }
+
+
+def test_get_prefixed_functions_returns_copy():
+    """When called more than once with the same prefix and object,
+    :func:`get_prefixed_functions` should return a new :class:`dict`
+    each time, so changes to one don't affect the others.
+    """
+    first = u.get_prefixed_functions('spam_', spam)
+    first.clear()
+    assert u.get_prefixed_functions('spam_', spam) == {
+        'eggs': spam.spam_eggs,
+        'bacon': spam.spam_bacon,
+        'baked_beans': spam.spam_baked_beans,
+    }
+
+
+def test_translate_by_polar_coords():
+    """Given a starting location, a rho, and a theta,
+    :func:`translate_by_polar_coords` should return the location
+    that distance away from the starting location.
+    """
+    y, x = u.translate_by_polar_coords((1.0, 2.0), 2.0, np.pi / 2)
+    assert round(y, 4) == 3.0
+    assert round(x, 4) == 2.0
+
+
+def test_translate_by_polar_coords_batch():
+    """Given a starting location, a rho, and an array of thetas,
+    :func:`translate_by_polar_coords_batch` should return arrays
+    of the Y and X coordinates of the locations those distances
+    away from the starting location.
+    """
+    o = np.array([0.0, np.pi / 2, np.pi])
+    ys, xs = u.translate_by_polar_coords_batch((1.0, 2.0), 2.0, o)
+    assert (np.around(ys, 4) == np.array([1.0, 3.0, 1.0])).all()
+    assert (np.around(xs, 4) == np.array([4.0, 2.0, 0.0])).all()